@@ -0,0 +1,53 @@
+"""
+Helpers shared by Alembic data migrations.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+def BackfillInBatches(
+    tableName: str, assignments: str, condition: str = "TRUE", batchSize: int = 10_000
+) -> int:
+    """
+    Update the rows of a table in keyset-paginated batches, committing after each batch.
+    A single UPDATE over a large table holds its row locks until the end of the statement
+    and grows the WAL without bound; walking the primary key in fixed-size batches keeps
+    both the lock duration and the transaction size bounded.
+    The batches run inside an autocommit block, so the helper must not be used in offline
+    (--sql) mode and the migration calling it is not atomic.
+    :param tableName: The table to update, e.g. 't_users'.
+    :param assignments: The SET clause, e.g. '"createdAt" = now()'.
+    :param condition: Optional filter selecting the rows to update, e.g. '"createdAt" IS NULL'.
+    :param batchSize: Maximum number of rows updated per transaction.
+    :return: The total number of updated rows.
+    """
+    firstBatch = sa.text(
+        f"WITH batch AS ("
+        f"SELECT id FROM {tableName} WHERE {condition} ORDER BY id LIMIT :batchSize"
+        f") UPDATE {tableName} SET {assignments} FROM batch "
+        f"WHERE {tableName}.id = batch.id RETURNING {tableName}.id"
+    )
+    nextBatch = sa.text(
+        f"WITH batch AS ("
+        f"SELECT id FROM {tableName} WHERE id > :lastId AND ({condition}) "
+        f"ORDER BY id LIMIT :batchSize"
+        f") UPDATE {tableName} SET {assignments} FROM batch "
+        f"WHERE {tableName}.id = batch.id RETURNING {tableName}.id"
+    )
+
+    updatedRows = 0
+    # pylint: disable=no-member
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        ids = connection.execute(firstBatch, {"batchSize": batchSize}).scalars().all()
+        while ids:
+            updatedRows += len(ids)
+            if len(ids) < batchSize:
+                break
+            ids = (
+                connection.execute(nextBatch, {"batchSize": batchSize, "lastId": max(ids)})
+                .scalars()
+                .all()
+            )
+    return updatedRows
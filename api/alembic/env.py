@@ -1,3 +1,4 @@
+import sys
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config
@@ -5,7 +6,10 @@ from sqlalchemy import pool
 
 from alembic import context
 from dotenv import load_dotenv
-from os import getenv
+from os import getenv, path
+
+# Revisions import the migration helpers kept next to this file, e.g. `from Migrations import ...`
+sys.path.insert(0, path.dirname(path.abspath(__file__)))
 
 load_dotenv(dotenv_path="../.env")
 load_dotenv()
@@ -49,6 +53,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        transaction_per_migration=True,
     )
 
     with context.begin_transaction():
@@ -72,7 +77,13 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        # PostgreSQL runs DDL transactionally, so each revision's statements share one
+        # BEGIN/COMMIT, and a failing revision rolls back alone instead of the whole run
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            transaction_per_migration=True,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
@@ -0,0 +1,39 @@
+"""Store t_authentication_codes scopes as a text array
+
+Revision ID: 2e7a5c9f1b84
+Revises: 9c4e1b7a3d21
+Create Date: 2026-10-15 11:41:18.663052
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2e7a5c9f1b84"
+down_revision: Union[str, Sequence[str], None] = "9c4e1b7a3d21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "ALTER TABLE t_authentication_codes "
+        "ALTER COLUMN scopes TYPE VARCHAR[] "
+        "USING COALESCE(string_to_array(scopes, ','), '{}'), "
+        "ALTER COLUMN scopes SET DEFAULT '{}', "
+        "ALTER COLUMN scopes SET NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        "ALTER TABLE t_authentication_codes "
+        "ALTER COLUMN scopes DROP NOT NULL, "
+        "ALTER COLUMN scopes DROP DEFAULT, "
+        "ALTER COLUMN scopes TYPE VARCHAR "
+        "USING NULLIF(array_to_string(scopes, ','), '')"
+    )
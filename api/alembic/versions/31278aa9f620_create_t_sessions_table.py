@@ -11,7 +11,6 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
-from src.Session.Infrastructure.Database.Models import SessionDatabaseModel
 
 
 # revision identifiers, used by Alembic.
@@ -23,7 +22,7 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     op.create_table(
-        SessionDatabaseModel.__tablename__,
+        "t_sessions",
         sa.Column(
             "id",
             postgresql.UUID(as_uuid=True),
@@ -60,4 +59,4 @@ def upgrade() -> None:
 
 
 def downgrade() -> None:
-    op.drop_table(SessionDatabaseModel.__tablename__)
+    op.drop_table("t_sessions")
@@ -0,0 +1,31 @@
+"""Add keyset pagination indexes for the user listing
+
+Revision ID: 3a8d6f2c1e95
+Revises: 6d1f8b3e0a57
+Create Date: 2026-10-15 14:20:11.604318
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3a8d6f2c1e95"
+down_revision: Union[str, Sequence[str], None] = "6d1f8b3e0a57"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The listing seeks on (sort column, id); id and email are already unique indexes,
+    # so only the timestamp sorts need a composite index to seek without sorting
+    op.create_index("ix_users_created_id", "t_users", ["createdAt", "id"])
+    op.create_index("ix_users_updated_id", "t_users", ["updatedAt", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_updated_id", table_name="t_users")
+    op.drop_index("ix_users_created_id", table_name="t_users")
@@ -0,0 +1,40 @@
+"""Add indexes on foreign key columns
+
+Revision ID: 5b9e4d7c2f10
+Revises: 8f3c2a1d9b47
+Create Date: 2026-10-15 09:47:03.518262
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b9e4d7c2f10"
+down_revision: Union[str, Sequence[str], None] = "8f3c2a1d9b47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# PostgreSQL does not index the referencing side of a foreign key, so joins and
+# cascade checks on these columns fall back to sequential scans without them
+indexedColumns: Sequence[tuple[str, str]] = (
+    ("t_authentication_credentials", "userId"),
+    ("t_role_assignments", "userId"),
+    ("t_role_assignments", "roleId"),
+    ("t_authentication_codes", "userId"),
+    ("t_sessions", "userId"),
+    ("t_sessions", "authenticationCodeId"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for tableName, columnName in indexedColumns:
+        op.create_index(f"ix_{tableName}_{columnName}", tableName, [columnName])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for tableName, columnName in reversed(indexedColumns):
+        op.drop_index(f"ix_{tableName}_{columnName}", table_name=tableName)
@@ -0,0 +1,35 @@
+"""Add partial index over active sessions
+
+Revision ID: 6d1f8b3e0a57
+Revises: 2e7a5c9f1b84
+Create Date: 2026-10-15 12:05:52.381944
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "6d1f8b3e0a57"
+down_revision: Union[str, Sequence[str], None] = "2e7a5c9f1b84"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Sessions stay active until revoked, which sets expiresAt. now() cannot appear in an
+    # index predicate, so the index covers the never-revoked rows only
+    op.create_index(
+        "ix_sessions_active",
+        "t_sessions",
+        ["userId"],
+        postgresql_where=sa.text('"expiresAt" IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_sessions_active", table_name="t_sessions")
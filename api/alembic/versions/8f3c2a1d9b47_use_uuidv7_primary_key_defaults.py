@@ -0,0 +1,63 @@
+"""Use time-ordered uuidv7() as the default primary key of every table
+
+Revision ID: 8f3c2a1d9b47
+Revises: 477d10c8c6ac
+Create Date: 2026-10-15 09:12:41.204117
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8f3c2a1d9b47"
+down_revision: Union[str, Sequence[str], None] = "477d10c8c6ac"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables whose "id" primary key defaulted to gen_random_uuid()
+tableNames: Sequence[str] = (
+    "t_authentication_credentials",
+    "t_roles",
+    "t_role_assignments",
+    "t_users",
+    "t_authentication_codes",
+    "t_sessions",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # UUIDv7: 48-bit unix timestamp in milliseconds followed by random bits, so new keys
+    # are appended to the right edge of the primary key B-tree instead of random pages
+    op.execute("""
+        CREATE OR REPLACE FUNCTION public.uuidv7() RETURNS uuid AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            PLACING substring(
+                                int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+                                FROM 3
+                            )
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid;
+        $$ LANGUAGE sql VOLATILE
+        """)
+    for tableName in tableNames:
+        op.execute(f"ALTER TABLE {tableName} ALTER COLUMN id SET DEFAULT public.uuidv7()")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for tableName in tableNames:
+        op.execute(f"ALTER TABLE {tableName} ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+    op.execute("DROP FUNCTION IF EXISTS public.uuidv7()")
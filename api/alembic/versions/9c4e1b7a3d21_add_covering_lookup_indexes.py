@@ -0,0 +1,43 @@
+"""Add covering lookup indexes for authentication codes and sessions
+
+Revision ID: 9c4e1b7a3d21
+Revises: 5b9e4d7c2f10
+Create Date: 2026-10-15 11:12:40.204117
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c4e1b7a3d21"
+down_revision: Union[str, Sequence[str], None] = "5b9e4d7c2f10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The code exchange reads the whole row by code, so carry the remaining columns
+    # in the unique index itself and let it replace the plain unique constraint
+    op.execute(
+        "CREATE UNIQUE INDEX ix_authcodes_code_incl ON t_authentication_codes (code) "
+        'INCLUDE ("expiresAt", "userId", "clientId", "codeChallenge", scopes)'
+    )
+    op.drop_constraint("t_authentication_codes_code_key", "t_authentication_codes", type_="unique")
+
+    # (userId, expiresAt) serves every lookup the single column index did
+    op.create_index("ix_sessions_user_expires", "t_sessions", ["userId", "expiresAt"])
+    op.drop_index("ix_t_sessions_userId", table_name="t_sessions")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_t_sessions_userId", "t_sessions", ["userId"])
+    op.drop_index("ix_sessions_user_expires", table_name="t_sessions")
+
+    op.create_unique_constraint(
+        "t_authentication_codes_code_key", "t_authentication_codes", ["code"]
+    )
+    op.drop_index("ix_authcodes_code_incl", table_name="t_authentication_codes")
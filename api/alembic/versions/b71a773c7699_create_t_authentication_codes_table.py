@@ -11,7 +11,6 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
-from src.Authentication.Infrastructure.Database.Models import AuthenticationCodeDatabaseModel
 
 
 # revision identifiers, used by Alembic.
@@ -24,7 +23,7 @@ depends_on: Union[str, Sequence[str], None] = None
 def upgrade() -> None:
     """Upgrade schema."""
     op.create_table(
-        AuthenticationCodeDatabaseModel.__tablename__,
+        "t_authentication_codes",
         sa.Column(
             "id",
             postgresql.UUID(as_uuid=True),
@@ -48,4 +47,4 @@ def upgrade() -> None:
 
 def downgrade() -> None:
     """Downgrade schema."""
-    op.drop_table(AuthenticationCodeDatabaseModel.__tablename__)
+    op.drop_table("t_authentication_codes")
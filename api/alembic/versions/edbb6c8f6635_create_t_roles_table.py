@@ -11,7 +11,6 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
-from src.Authentication.Infrastructure.Database.Models import RoleDatabaseModel
 
 
 # revision identifiers, used by Alembic.
@@ -1,11 +1,18 @@
+from contextvars import ContextVar
 from time import time
+from typing import List, Optional
 from dotenv import load_dotenv
 from sqlalchemy.engine import Engine as DatabaseEngine
 from sqlalchemy import Connection as DatabaseConnection
 from sqlalchemy.orm import Session as DatabaseSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import scoped_session, sessionmaker
 import sqlalchemy as sa
+from sqlalchemy import event
 from fastapi import FastAPI, APIRouter, status, Request
+from fastapi.exception_handlers import http_exception_handler
+from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.exceptions import HTTPException as StarletteHTTPException
 import uvicorn
 
 # Config
@@ -13,9 +20,12 @@ from src.Shared.Config.AppConfig import AppConfig
 
 # Shared
 from src.Shared.DependencyInjection.Container import Container
+from src.Shared.Enums import LogLevelEnum
 from src.Shared.Logging.Interfaces import ILogger
 from src.Shared.Logging.Models import Logger
 from src.Shared.Events.Models import EventDispatcher
+from src.Shared.UnitOfWork.Interfaces import IUnitOfWork
+from src.Shared.UnitOfWork.Models import SqlUnitOfWork
 
 # Authentication
 from src.Authentication.Infrastructure.Dependencies import AuthenticationDependencies
@@ -36,27 +46,52 @@ appConfig: AppConfig = AppConfig.FromEnv()
 # Initialize the Container
 container: Container = Container.FromAppConfig(appConfig)
 
+# Database engine and session factory, built once per process
+databaseEngine: DatabaseEngine = sa.create_engine(
+    appConfig.databaseUrl,
+    pool_size=appConfig.databasePoolSize,
+    max_overflow=appConfig.databaseMaxOverflow,
+    pool_pre_ping=True,
+    pool_recycle=appConfig.databasePoolRecycleSeconds,
+)
+# SQL statements issued by the current request, in a mutable cell so the count made in a
+# threadpool worker's copy of the context reaches the middleware
+requestQueryCount: ContextVar[Optional[List[int]]] = ContextVar("requestQueryCount", default=None)
+
+
+@event.listens_for(databaseEngine, "before_cursor_execute")
+def CountQuery(*_args):
+    queryCount = requestQueryCount.get()
+    if queryCount is not None:
+        queryCount[0] += 1
+
+
+sessionFactory: sessionmaker = sessionmaker(bind=databaseEngine, expire_on_commit=False)
+# One session per request, shared by the repositories and the unit of work; the scope
+# follows the request into the threadpool, where the sync routes run
+requestScope: ContextVar[object] = ContextVar("requestScope", default=None)
+databaseSession: scoped_session[DatabaseSession] = scoped_session(
+    sessionFactory, scopefunc=requestScope.get
+)
+
 # Singletons registration
 container.RegisterSingletons(
     {
         AppConfig.__name__: lambda container: appConfig,
-        DatabaseEngine.__name__: lambda container: sa.create_engine(
-            appConfig.databaseUrl,
+        DatabaseEngine.__name__: lambda container: databaseEngine,
+        ILogger.__name__: lambda container: Logger(
+            target=appConfig.logTarget, level=appConfig.logLevel
         ),
-        ILogger.__name__: lambda container: Logger(target=appConfig.logTarget),
         EventDispatcher.__name__: lambda container: EventDispatcher(),
+        DatabaseSession.__name__: lambda container: databaseSession,
+        IUnitOfWork.__name__: lambda container: SqlUnitOfWork(session=databaseSession),
     }
 )
 
 # Factories registration
 container.RegisterFactories(
     {
-        DatabaseConnection.__name__: lambda container: container.Get(
-            DatabaseEngine.__name__
-        ).connect(),
-        DatabaseSession.__name__: lambda container: sessionmaker(
-            bind=container.Get(DatabaseEngine.__name__)
-        )(),
+        DatabaseConnection.__name__: lambda container: databaseEngine.connect(),
     }
 )
 
@@ -64,6 +99,9 @@ container.RegisterFactories(
 AuthenticationDependencies.RegisterDependencies(container)
 SessionDependencies.RegisterDependencies(container)
 
+# Resolve per-request singletons once
+logger: ILogger = container.Get(ILogger.__name__)
+
 # Initialize FastAPI app
 app: FastAPI = FastAPI(title=appConfig.appName, version=appConfig.version)
 
@@ -91,43 +129,74 @@ async def HealthCheck():
     return {"status": "healthy"}
 
 
-# Catch-all for undefined routes
-@apiV1Router.get("/{fullPath:path}", tags=["CatchAll"], status_code=status.HTTP_404_NOT_FOUND)
-async def CatchAll(fullPath: str):
-    return {"error": "Endpoint not found", "path": fullPath}
-
-
 # Include the router in the main app
 app.include_router(apiV1Router)
 
 
+# Undefined routes, answered from the router's own miss instead of a catch-all route
+@app.exception_handler(status.HTTP_404_NOT_FOUND)
+async def NotFound(request: Request, exc: StarletteHTTPException):  # pylint: disable=invalid-name
+    # Endpoints raising their own 404 keep their detail
+    if exc.detail != "Not Found":
+        return await http_exception_handler(request, exc)
+    return JSONResponse(
+        status_code=status.HTTP_404_NOT_FOUND,
+        content={"error": "Endpoint not found", "path": request.url.path},
+    )
+
+
 # Register middleware, event handlers, etc.
 @app.middleware("http")
 async def LogIncomingRequests(request: Request, call_next):  # pylint: disable=invalid-name
-    logger: ILogger = container.Get(ILogger.__name__)
-    logger.Info("=" * 50)
-    logger.Info(f"{appConfig.appName} API")
-    logger.Info("Incoming request...")
-    logger.Info(f"[{request.method}] {request.url}")
-    logger.Info(f"Headers: {dict(request.headers)}")
-    logger.Info("+" * 50)
+    if logger.IsEnabled(LogLevelEnum.INFO):
+        logger.Info(f"{appConfig.appName} API - [{request.method}] {request.url}")
+    if logger.IsEnabled(LogLevelEnum.DEBUG):
+        logger.Debug(f"Request headers: {dict(request.headers)}")
 
     response = await call_next(request)
 
-    logger.Info(f"Response headers: {dict(response.headers)}")
-    logger.Info(f"Response status: {response.status_code}")
-    logger.Info("=" * 50)
+    if logger.IsEnabled(LogLevelEnum.INFO):
+        logger.Info(f"[{request.method}] {request.url} - Response status: {response.status_code}")
+    if logger.IsEnabled(LogLevelEnum.DEBUG):
+        logger.Debug(f"Response headers: {dict(response.headers)}")
     return response
 
 
+@app.middleware("http")
+async def ScopeDatabaseSession(request: Request, call_next):  # pylint: disable=invalid-name
+    token = requestScope.set(object())
+    try:
+        return await call_next(request)
+    finally:
+        # Closing returns the connection to the pool, so read-only requests don't leave
+        # it idle in transaction until the thread's next write commits
+        await run_in_threadpool(databaseSession.remove)
+        requestScope.reset(token)
+
+
+@app.middleware("http")
+async def CountRequestQueries(request: Request, call_next):  # pylint: disable=invalid-name
+    queryCount = [0]
+    token = requestQueryCount.set(queryCount)
+    try:
+        return await call_next(request)
+    finally:
+        requestQueryCount.reset(token)
+        # Runaway statement counts usually mean an N+1 slipped into a query path
+        if queryCount[0] > appConfig.queryCountWarningThreshold:
+            logger.Warning(
+                f"[{request.method}] {request.url.path} issued {queryCount[0]} SQL statements"
+            )
+
+
 @app.middleware("http")
 async def CalculateProcessingTime(request: Request, call_next):  # pylint: disable=invalid-name
-    logger: ILogger = container.Get(ILogger.__name__)
     startTime = time()
     response = await call_next(request)
     processTime = time() - startTime
     response.headers["X-Process-Time"] = str(processTime)
-    logger.Info(f"Processed request in {processTime:.4f} seconds")
+    if logger.IsEnabled(LogLevelEnum.INFO):
+        logger.Info(f"Processed request in {processTime:.4f} seconds")
     return response
 
 
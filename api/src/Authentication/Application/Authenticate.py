@@ -7,10 +7,17 @@ from src.Authentication.Domain.Interfaces import (
     ISessionService,
 )
 from src.Shared.Events.Models import EventDispatcher
+from src.Shared.Enums import LogLevelEnum
 from src.Shared.Logging.Interfaces import ILogger
+from src.Shared.UnitOfWork.Interfaces import IUnitOfWork
 from src.Authentication.Domain.Models import AuthenticationCredentials
 from src.Authentication.Domain.Sevices import AuthenticationCodeService
 
+# Hash compared against when the user does not exist, so unknown usernames cost the same
+# verification time as wrong passwords. A bcrypt hash at the hashing service's cost (12) of a
+# random password that was discarded, so nothing verifies against it
+DUMMY_PASSWORD_HASH = "$2b$12$QsgHPEB.hVVgvtcjwNux6OGmPjMRTBfFQFiBQKnR1NsXuVwa4oOzi"
+
 
 class AuthenticateCommand(BaseModel):
     username: str = Field(min_length=3, max_length=50)
@@ -33,7 +40,7 @@ class AuthenticateCommand(BaseModel):
         return self.__str__()
 
 
-class AuthenticateHandler:
+class AuthenticateHandler:  # pylint: disable=too-many-instance-attributes
     def __init__(
         self,
         userRepository: IUserRepository,
@@ -43,6 +50,7 @@ class AuthenticateHandler:
         sessionService: ISessionService,
         eventDispatcher: EventDispatcher,
         logger: ILogger,
+        unitOfWork: IUnitOfWork,
     ):
         self.userRepository = userRepository
         self.authCodeRepository = authCodeRepository
@@ -51,17 +59,19 @@ class AuthenticateHandler:
         self.sessionService = sessionService
         self.eventDispatcher = eventDispatcher
         self.logger = logger
+        self.unitOfWork = unitOfWork
 
     def Handle(self, command: AuthenticateCommand) -> tuple[str, str]:
         # Find the user by username
         user = self.userRepository.FindByUsername(command.username)
-        if not user:
-            self.logger.Warning(f"Authentication failed for username: {command.username}")
-            raise ValueError("Invalid username or password")
 
-        # Verify the password
-        credentials: AuthenticationCredentials = user.authenticationCredentials
-        if not self.hashingService.Verify(command.password, credentials.passwordHash):
+        # Verify the password, even for unknown users
+        passwordHash = DUMMY_PASSWORD_HASH
+        if user:
+            credentials: AuthenticationCredentials = user.authenticationCredentials
+            passwordHash = credentials.passwordHash
+        isValid = self.hashingService.Verify(command.password, passwordHash)
+        if not user or not isValid:
             self.logger.Warning(f"Authentication failed for username: {command.username}")
             raise ValueError("Invalid username or password")
 
@@ -73,20 +83,20 @@ class AuthenticateHandler:
             codeChallenge=command.codeChallenge,
         )
 
-        # Create a new session for the user
-        sessionId: UUID = self.sessionService.CreatePasswordSession(
-            userId=user.id,
-            clientId=UUID(command.clientId),
-            scopes=command.scopes,
-            codeChallenge=command.codeChallenge,
-            authenticationCodeId=authenticationCode.id,
-        )
-
-        # Store the authentication code
-        self.authCodeRepository.Save(authenticationCode)
+        # Create the session and store the code in a single transaction
+        with self.unitOfWork:
+            sessionId: UUID = self.sessionService.CreatePasswordSession(
+                userId=user.id,
+                clientId=UUID(command.clientId),
+                scopes=command.scopes,
+                codeChallenge=command.codeChallenge,
+                authenticationCodeId=authenticationCode.id,
+            )
+            self.authCodeRepository.Save(authenticationCode)
 
         # Dispatch events if any (e.g., login events)
         self.eventDispatcher.DispatchAll(authenticationCode.ReleaseEvents())
 
-        self.logger.Info(f"User {user.id} authenticated successfully")
+        if self.logger.IsEnabled(LogLevelEnum.INFO):
+            self.logger.Info(f"User {user.id} authenticated successfully")
         return authenticationCode.code, str(sessionId)
@@ -1,31 +1,76 @@
-from typing import List, Dict, Any, Optional
-from pydantic import BaseModel, Field, field_validator
+import base64
+import binascii
+import json
+from typing import List, Dict, Any, Literal, Optional, Tuple
+from uuid import UUID
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
 from src.Authentication.Domain.Interfaces import IUserRepository
 from src.Authentication.Domain.Models import User
+from src.Shared.Enums import LogLevelEnum
+from src.Shared.Identifiers import AsUuid
 from src.Shared.Logging.Interfaces import ILogger
+from src.Shared.Models import AsDatetime
+
+
+UserSortField = Literal["id", "email", "username", "createdAt", "updatedAt"]
+SortOrder = Literal["asc", "desc"]
 
 
 class ListAllUsersCommand(BaseModel):
-    sortBy: str = Field(default="id")
-    sortOrder: str = Field(default="asc")
+    sortBy: UserSortField = "id"
+    sortOrder: SortOrder = "asc"
     limit: int = Field(default=10, ge=1, le=100)
     offset: int = Field(default=0, ge=0)
+    # Opaque keyset cursor from the previous page's X-Next-Cursor header
+    cursor: Optional[str] = None
 
-    @field_validator("sortBy")
+    @field_validator("cursor")
     @classmethod
-    def ValidateSortBy(cls, value: str) -> str:
-        allowedSortFields = {"id", "email", "username", "createdAt", "updatedAt"}
-        if value not in allowedSortFields:
-            raise ValueError(f"sortBy must be one of {allowedSortFields}")
+    def ValidateCursor(cls, value: Optional[str], info: ValidationInfo) -> Optional[str]:
+        if value is not None:
+            DecodeCursor(value, info.data.get("sortBy", "id"))
         return value
 
-    @field_validator("sortOrder")
-    @classmethod
-    def ValidateSortOrder(cls, value: str) -> str:
-        allowedSortOrders = {"asc", "desc"}
-        if value not in allowedSortOrders:
-            raise ValueError(f"sortOrder must be one of {allowedSortOrders}")
-        return value
+
+def EncodeCursor(sortValue: Any, id: Any) -> str:
+    """
+    Encode the sort value and id of the last user of a page into an opaque cursor.
+    """
+    return base64.urlsafe_b64encode(json.dumps([sortValue, str(id)]).encode("utf-8")).decode(
+        "ascii"
+    )
+
+
+def DecodeCursor(cursor: str, sortBy: str) -> Tuple[Any, UUID]:
+    """
+    Decode a cursor created by EncodeCursor into the sort value and id of the last user
+    of the previous page, typed for comparison in the database.
+    """
+    try:
+        sortValue, id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        if sortBy == "id":
+            sortValue = AsUuid(sortValue)
+        elif sortBy in ("createdAt", "updatedAt"):
+            sortValue = AsDatetime(sortValue)
+        return sortValue, AsUuid(id)
+    except (binascii.Error, UnicodeError, AttributeError, TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def NextCursor(command: ListAllUsersCommand, users: List[Dict[str, Any]]) -> Optional[str]:
+    """
+    Cursor for the page following the given serialized users, or None if it was the last one.
+    """
+    if len(users) < command.limit:
+        return None
+
+    lastUser = users[-1]
+    sortValue = (
+        lastUser["authenticationCredentials"]["username"]
+        if command.sortBy == "username"
+        else lastUser[command.sortBy]
+    )
+    return EncodeCursor(sortValue, lastUser["id"])
 
 
 class ListAllUsersHandler:
@@ -36,15 +81,18 @@ class ListAllUsersHandler:
     def Handle(self, command: Optional[ListAllUsersCommand] = None) -> List[Dict[str, Any]]:
         command = command or ListAllUsersCommand()
 
-        self.logger.Info(
-            f"""Listing users sorted by {command.sortBy} in 
+        if self.logger.IsEnabled(LogLevelEnum.INFO):
+            self.logger.Info(
+                f"""Listing users sorted by {command.sortBy} in 
             {command.sortOrder} order, limit {command.limit}, offset {command.offset}"""
-        )
+            )
         users = self.userRepository.ListAll(
             sortBy=command.sortBy,
             sortOrder=command.sortOrder,
             limit=command.limit,
             offset=command.offset,
+            after=DecodeCursor(command.cursor, command.sortBy) if command.cursor else None,
         )
-        self.logger.Info(f"Listed {len(users)} users")
+        if self.logger.IsEnabled(LogLevelEnum.INFO):
+            self.logger.Info(f"Listed {len(users)} users")
         return User.ToDicts(users)
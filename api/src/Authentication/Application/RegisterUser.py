@@ -5,6 +5,7 @@ from src.Authentication.Domain.Models import User
 from src.Authentication.Domain.Sevices import UniquenessService
 from src.Shared.Events.Models import EventDispatcher
 from src.Shared.Logging.Interfaces import ILogger
+from src.Shared.UnitOfWork.Interfaces import IUnitOfWork
 
 
 class RegisterUserCommand(BaseModel):
@@ -12,6 +13,14 @@ class RegisterUserCommand(BaseModel):
     username: str = Field(min_length=3, max_length=50)
     password: str = Field(min_length=8, max_length=128)
 
+    def __str__(self):
+        # Avoid logging sensitive information like passwords
+        return f"RegisterUserCommand(email={self.email}, username={self.username}, password=****)"
+
+    def __repr__(self):
+        # Avoid logging sensitive information like passwords
+        return self.__str__()
+
 
 class RegisterUserHandler:
     def __init__(
@@ -21,17 +30,18 @@ class RegisterUserHandler:
         uniquenessService: UniquenessService,
         eventDispatcher: EventDispatcher,
         logger: ILogger,
+        unitOfWork: IUnitOfWork,
     ):
         self.userRepository = userRepository
         self.hashingService = hashingService
         self.uniquenessService = uniquenessService
         self.eventDispatcher = eventDispatcher
         self.logger = logger
+        self.unitOfWork = unitOfWork
 
     def Handle(self, command: RegisterUserCommand) -> UUID:
         # Validate
-        self.uniquenessService.ValidateIsEmailUnique(command.email)
-        self.uniquenessService.ValidateIsUsernameUnique(command.username)
+        self.uniquenessService.ValidateUnique(command.email, command.username)
 
         # Hash the password
         passwordHash = self.hashingService.Hash(command.password)
@@ -44,9 +54,10 @@ class RegisterUserHandler:
         )
 
         # Save the user
-        self.userRepository.Save(newUser)
+        with self.unitOfWork:
+            self.userRepository.Save(newUser)
 
-        # Dispatch events
+        # Dispatch events once the user is committed
         self.eventDispatcher.DispatchAll(newUser.ReleaseEvents())
 
         # Return the new user's ID
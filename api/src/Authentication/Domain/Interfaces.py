@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, List, Optional, Tuple
 from uuid import UUID
 
 from src.Authentication.Domain.Models import User, AuthenticationCode
@@ -20,7 +20,18 @@ class IUserRepository(ABC):
         pass
 
     @abstractmethod
-    def ListAll(self, sortBy: str, sortOrder: str, limit: int, offset: int) -> list[User]:
+    def ExistsByEmailOrUsername(self, email: str, username: str) -> Tuple[bool, bool]:
+        pass
+
+    @abstractmethod
+    def ListAll(
+        self,
+        sortBy: str,
+        sortOrder: str,
+        limit: int,
+        offset: int,
+        after: Optional[Tuple[Any, UUID]] = None,
+    ) -> list[User]:
         pass
 
     @abstractmethod
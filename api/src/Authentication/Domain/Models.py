@@ -1,11 +1,16 @@
 import re
+from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
-from datetime import datetime, timezone
-from uuid import UUID, uuid4
-from pydantic import Field
-from src.Shared.Models import HistoryClass
+from datetime import datetime
+from uuid import UUID
+from pydantic import Field, PrivateAttr
+from pydantic_core import to_jsonable_python
+from src.Shared.Identifiers import AsUuid, Uuid7
+from src.Shared.Models import AsDatetime, HistoryClass, UtcNow
 from src.Shared.Events.Models import EventEmitter
 
+_EMAIL_RE = re.compile(r"[^@]+@[^@]+\.[^@]+")
+
 
 class AuthenticationCredentials(HistoryClass, EventEmitter):
     """
@@ -56,10 +61,8 @@ class AuthenticationCredentials(HistoryClass, EventEmitter):
         Factory method to create a new AuthenticationCredentials instance.
         """
 
-        now = datetime.now(timezone.utc)
-
         # Generate a new UUID for the credentials
-        id: UUID = uuid4()
+        id: UUID = Uuid7()
 
         authenticationCredentials = cls(
             id=id,
@@ -68,8 +71,6 @@ class AuthenticationCredentials(HistoryClass, EventEmitter):
             passwordHash=passwordHash,
             mfaEnabled=mfaEnabled,
             mfaSecret=mfaSecret,
-            createdAt=now,
-            updatedAt=now,
         )
 
         # Emit event for creation if needed
@@ -83,17 +84,18 @@ class AuthenticationCredentials(HistoryClass, EventEmitter):
     def FromDatabase(cls, data: Dict[str, Any]) -> "AuthenticationCredentials":
         """
         Factory method to create an AuthenticationCredentials instance from database data.
+        The data is trusted, so validation is skipped.
         """
 
-        return cls(
-            id=data["id"] if isinstance(data["id"], UUID) else UUID(data["id"]),
-            userId=UUID(data["userId"]),
+        return cls.model_construct(
+            id=AsUuid(data["id"]),
+            userId=AsUuid(data["userId"]),
             username=data["username"],
             passwordHash=data["passwordHash"],
             mfaEnabled=data["mfaEnabled"],
             mfaSecret=data.get("mfaSecret"),
-            createdAt=datetime.fromisoformat(data["createdAt"]),
-            updatedAt=datetime.fromisoformat(data["updatedAt"]),
+            createdAt=AsDatetime(data["createdAt"]),
+            updatedAt=AsDatetime(data["updatedAt"]),
         )
 
     def ToDict(self) -> Dict[str, Any]:
@@ -101,18 +103,8 @@ class AuthenticationCredentials(HistoryClass, EventEmitter):
         Serialize the AuthenticationCredentials instance to a dictionary.
         """
 
-        return {
-            "id": str(self.id),
-            "userId": str(self.userId),
-            "username": self.username,
-            "passwordHash": self.passwordHash,
-            "mfaEnabled": self.mfaEnabled,
-            "mfaSecret": self.mfaSecret,
-            "createdAt": self.createdAt.isoformat(),
-            "updatedAt": self.updatedAt.isoformat(),
-        }
+        return self.model_dump(mode="json", exclude={"events"})
 
-    @HistoryClass.UpdateTimestamp
     def ChangePassword(self, newPasswordHash: str) -> None:
         """
         Change the password hash and emit a PasswordChanged event.
@@ -120,10 +112,10 @@ class AuthenticationCredentials(HistoryClass, EventEmitter):
 
         # oldPasswordHash = self.passwordHash
         self.passwordHash = newPasswordHash
+        self.updatedAt = UtcNow()
         # Emit event for password change
         # self.EmitEvent(PasswordChanged.FromModel(oldPasswordHash, self))
 
-    @HistoryClass.UpdateTimestamp
     def EnableMFA(self, mfaSecret: str) -> None:
         """
         Enable MFA and set the MFA secret; emit an MFAEnabled event.
@@ -133,10 +125,10 @@ class AuthenticationCredentials(HistoryClass, EventEmitter):
 
         self.mfaEnabled = True
         self.mfaSecret = mfaSecret
+        self.updatedAt = UtcNow()
         # Emit event for enabling MFA
         # self.EmitEvent(MFAEnabled.FromModel(self))
 
-    @HistoryClass.UpdateTimestamp
     def DisableMFA(self) -> None:
         """
         Disable MFA and clear the MFA secret; emit an MFADisabled event.
@@ -144,6 +136,7 @@ class AuthenticationCredentials(HistoryClass, EventEmitter):
 
         self.mfaEnabled = False
         self.mfaSecret = None
+        self.updatedAt = UtcNow()
         # Emit event for disabling MFA
         # self.EmitEvent(MFADisabled.FromModel(self))
 
@@ -185,17 +178,13 @@ class Role(HistoryClass, EventEmitter):
         Factory method to create a new Role instance.
         """
 
-        now = datetime.now(timezone.utc)
-
         # Generate a new UUID for the role
-        id: UUID = uuid4()
+        id: UUID = Uuid7()
 
         role = cls(
             id=id,
             name=name,
             description=description,
-            createdAt=now,
-            updatedAt=now,
         )
 
         # Emit event for creation if needed
@@ -207,14 +196,15 @@ class Role(HistoryClass, EventEmitter):
     def FromDatabase(cls, data: Dict[str, Any]) -> "Role":
         """
         Factory method to create a Role instance from database data.
+        The data is trusted, so validation is skipped.
         """
 
-        return cls(
-            id=data["id"] if isinstance(data["id"], UUID) else UUID(data["id"]),
+        return cls.model_construct(
+            id=AsUuid(data["id"]),
             name=data["name"],
             description=data.get("description"),
-            createdAt=datetime.fromisoformat(data["createdAt"]),
-            updatedAt=datetime.fromisoformat(data["updatedAt"]),
+            createdAt=AsDatetime(data["createdAt"]),
+            updatedAt=AsDatetime(data["updatedAt"]),
         )
 
     def ToDict(self) -> Dict[str, Any]:
@@ -222,25 +212,18 @@ class Role(HistoryClass, EventEmitter):
         Serialize the Role instance to a dictionary.
         """
 
-        return {
-            "id": str(self.id),
-            "name": self.name,
-            "description": self.description,
-            "createdAt": self.createdAt.isoformat(),
-            "updatedAt": self.updatedAt.isoformat(),
-        }
+        return self.model_dump(mode="json", exclude={"events"})
 
-    @HistoryClass.UpdateTimestamp
     def ChangeDescription(self, newDescription: Optional[str]) -> None:
         """
         Change the role's description and emit a RoleDescriptionUpdated event.
         """
 
         self.description = newDescription
+        self.updatedAt = UtcNow()
         # Emit event for updating description
         # self.EmitEvent(RoleDescriptionChanged.FromModel(self))
 
-    @HistoryClass.UpdateTimestamp
     def ChangeName(self, newName: str) -> None:
         """
         Change the role's name and emit a RoleNameUpdated event.
@@ -252,13 +235,17 @@ class Role(HistoryClass, EventEmitter):
             return
 
         self.name = newName.strip()
+        self.updatedAt = UtcNow()
         # Emit event for updating name
         # self.EmitEvent(RoleNameChanged.FromModel(self))
 
 
-class RoleAssignment(HistoryClass):
+@dataclass(slots=True)
+class RoleAssignment:
     """
     RoleAssignment is a domain model representing the assignment of a role to a user.
+    It is a plain slotted dataclass rather than a pydantic model: it only ever holds
+    trusted identifiers, so it skips validation and the per-instance `__dict__`.
     Attributes:
         id (UUID):
             The unique identifier for the role assignment.
@@ -270,6 +257,7 @@ class RoleAssignment(HistoryClass):
             The timestamp when the role assignment was created.
         updatedAt (datetime):
             The timestamp when the role assignment was last updated.
+            Defaults to the creation timestamp.
     Methods:
         Create(cls, id: UUID, userId: UUID, roleId: UUID) -> "RoleAssignment":
             Factory method to create a new RoleAssignment instance.
@@ -282,9 +270,15 @@ class RoleAssignment(HistoryClass):
         which handles adding and removing role assignments and emitting relevant events.
     """
 
-    id: UUID = Field(default_factory=UUID)
-    userId: UUID = Field(default_factory=UUID)
-    roleId: UUID = Field(default_factory=UUID)
+    id: UUID
+    userId: UUID
+    roleId: UUID
+    createdAt: datetime = field(default_factory=UtcNow)
+    updatedAt: Optional[datetime] = None
+
+    def __post_init__(self) -> None:
+        if self.updatedAt is None:
+            self.updatedAt = self.createdAt
 
     @classmethod
     def Create(
@@ -296,17 +290,13 @@ class RoleAssignment(HistoryClass):
         Factory method to create a new RoleAssignment instance.
         """
 
-        now = datetime.now(timezone.utc)
-
         # Generate a new UUID for the role assignment
-        id: UUID = uuid4()
+        id: UUID = Uuid7()
 
         roleAssignment = cls(
             id=id,
-            userId=userId,
-            roleId=roleId,
-            createdAt=now,
-            updatedAt=now,
+            userId=AsUuid(userId),
+            roleId=AsUuid(roleId),
         )
 
         return roleAssignment
@@ -318,11 +308,11 @@ class RoleAssignment(HistoryClass):
         """
 
         return cls(
-            id=data["id"] if isinstance(data["id"], UUID) else UUID(data["id"]),
-            userId=data["userId"] if isinstance(data["userId"], UUID) else UUID(data["userId"]),
-            roleId=data["roleId"] if isinstance(data["roleId"], UUID) else UUID(data["roleId"]),
-            createdAt=datetime.fromisoformat(data["createdAt"]),
-            updatedAt=datetime.fromisoformat(data["updatedAt"]),
+            id=AsUuid(data["id"]),
+            userId=AsUuid(data["userId"]),
+            roleId=AsUuid(data["roleId"]),
+            createdAt=AsDatetime(data["createdAt"]),
+            updatedAt=AsDatetime(data["updatedAt"]),
         )
 
     def ToDict(self) -> Dict[str, Any]:
@@ -330,13 +320,7 @@ class RoleAssignment(HistoryClass):
         Serialize the RoleAssignment instance to a dictionary.
         """
 
-        return {
-            "id": str(self.id),
-            "userId": str(self.userId),
-            "roleId": str(self.roleId),
-            "createdAt": self.createdAt.isoformat(),
-            "updatedAt": self.updatedAt.isoformat(),
-        }
+        return to_jsonable_python(self)
 
 
 class User(HistoryClass, EventEmitter):
@@ -372,6 +356,8 @@ class User(HistoryClass, EventEmitter):
             Factory method to create a new User instance.
         FromDatabase(cls, data):
             Factory method to create a User instance from database data.
+        FromDatabaseBatch(cls, rows, credentialsByUserId, roleAssignmentsByUserId):
+            Factory method to create User instances from separately loaded database data.
         ToDict(self):
             Serialize the User instance to a dictionary.
         Activate(self):
@@ -398,6 +384,11 @@ class User(HistoryClass, EventEmitter):
     isVerified: bool = False
     authenticationCredentials: AuthenticationCredentials
     roleAssignments: list[RoleAssignment] = Field(default_factory=list)
+    # Role assignments by id, for constant time membership checks
+    _roleIndex: Dict[UUID, RoleAssignment] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, context: Any, /) -> None:
+        self._roleIndex = {ra.id: ra for ra in self.roleAssignments}
 
     @classmethod
     def Create(
@@ -414,10 +405,8 @@ class User(HistoryClass, EventEmitter):
         Factory method to create a new User instance.
         """
 
-        now = datetime.now(timezone.utc)
-
         # Generate a new UUID for the user
-        id: UUID = uuid4()
+        id: UUID = Uuid7()
 
         # Create authentication credentials
         authenticationCredentials = AuthenticationCredentials.Create(
@@ -436,8 +425,6 @@ class User(HistoryClass, EventEmitter):
             isVerified=isVerified,
             authenticationCredentials=authenticationCredentials,
             roleAssignments=[],
-            createdAt=now,
-            updatedAt=now,
         )
 
         # Emit event for creation if needed
@@ -449,10 +436,11 @@ class User(HistoryClass, EventEmitter):
     def FromDatabase(cls, data: Dict[str, Any]) -> "User":
         """
         Factory method to create a User instance from database data.
+        The data is trusted, so validation is skipped.
         """
 
-        return cls(
-            id=data["id"] if isinstance(data["id"], UUID) else UUID(data["id"]),
+        return cls.model_construct(
+            id=AsUuid(data["id"]),
             email=data["email"],
             isActive=data["isActive"],
             isVerified=data["isVerified"],
@@ -462,93 +450,110 @@ class User(HistoryClass, EventEmitter):
             roleAssignments=[
                 RoleAssignment.FromDatabase(ra) for ra in data.get("roleAssignments", [])
             ],
-            createdAt=datetime.fromisoformat(data["createdAt"]),
-            updatedAt=datetime.fromisoformat(data["updatedAt"]),
+            createdAt=AsDatetime(data["createdAt"]),
+            updatedAt=AsDatetime(data["updatedAt"]),
         )
 
+    @classmethod
+    def FromDatabaseBatch(
+        cls,
+        rows: List[Dict[str, Any]],
+        credentialsByUserId: Dict[UUID, Dict[str, Any]],
+        roleAssignmentsByUserId: Dict[UUID, List[Dict[str, Any]]],
+    ) -> List["User"]:
+        """
+        Factory method to create User instances from user rows and their related data,
+        loaded separately and grouped by user id.
+        """
+
+        return [
+            cls.FromDatabase(
+                {
+                    **row,
+                    "authenticationCredentials": credentialsByUserId[row["id"]],
+                    "roleAssignments": roleAssignmentsByUserId.get(row["id"], []),
+                }
+            )
+            for row in rows
+        ]
+
     def ToDict(self) -> Dict[str, Any]:
         """
         Serialize the User instance to a dictionary.
         """
 
-        return {
-            "id": str(self.id),
-            "email": self.email,
-            "isActive": self.isActive,
-            "isVerified": self.isVerified,
-            "authenticationCredentials": self.authenticationCredentials.ToDict(),
-            "roleAssignments": [ra.ToDict() for ra in self.roleAssignments],
-            "createdAt": self.createdAt.isoformat(),
-            "updatedAt": self.updatedAt.isoformat(),
-        }
+        return self.model_dump(
+            mode="json", exclude={"events": True, "authenticationCredentials": {"events"}}
+        )
 
-    @HistoryClass.UpdateTimestamp
     def Activate(self) -> None:
         """
         Activate the user and emit a UserActivated event.
         """
 
         self.isActive = True
+        self.updatedAt = UtcNow()
         # Emit event for activation
         # self.EmitEvent(UserActivated.FromModel(self))
 
-    @HistoryClass.UpdateTimestamp
     def Deactivate(self) -> None:
         """
         Deactivate the user and emit a UserDeactivated event.
         """
 
         self.isActive = False
+        self.updatedAt = UtcNow()
         # Emit event for deactivation
         # self.EmitEvent(UserDeactivated.FromModel(self))
 
-    @HistoryClass.UpdateTimestamp
     def Verify(self) -> None:
         """
         Verify the user and emit a UserVerified event.
         """
 
         self.isVerified = True
+        self.updatedAt = UtcNow()
         # Emit event for verification
         # self.EmitEvent(UserVerified.FromModel(self))
 
-    @HistoryClass.UpdateTimestamp
     def Unverify(self) -> None:
         """
         Unverify the user and emit a UserUnverified event.
         """
 
         self.isVerified = False
+        self.updatedAt = UtcNow()
         # Emit event for unverification
         # self.EmitEvent(UserUnverified.FromModel(self))
 
-    @HistoryClass.UpdateTimestamp
     def AddRoleAssignment(self, roleAssignment: RoleAssignment) -> None:
         """
         Add a role assignment to the user and emit a RoleAssignmentAdded event.
         """
 
-        if any(ra.id == roleAssignment.id for ra in self.roleAssignments):
+        if roleAssignment.id in self._roleIndex:
             raise ValueError("Role assignment already exists for user")
 
+        self._roleIndex[roleAssignment.id] = roleAssignment
         self.roleAssignments.append(roleAssignment)
+        self.updatedAt = UtcNow()
         # Emit event for adding role assignment
         # self.EmitEvent(RoleAssignmentAdded.FromModel(self, roleAssignment))
 
-    @HistoryClass.UpdateTimestamp
     def RemoveRoleAssignment(self, roleAssignmentId: UUID) -> None:
         """
         Remove a role assignment from the user and emit a RoleAssignmentRemoved event.
         """
 
-        if not any(ra.id == roleAssignmentId for ra in self.roleAssignments):
+        roleAssignment = self._roleIndex.pop(roleAssignmentId, None)
+        if roleAssignment is None:
             raise ValueError("Role assignment not found for user")
 
-        self.roleAssignments = [ra for ra in self.roleAssignments if ra.id != roleAssignmentId]
+        self.roleAssignments.remove(roleAssignment)
+        self.updatedAt = UtcNow()
         # Emit event for removing role assignment
         # self.EmitEvent(RoleAssignmentRemoved.FromModel(self, roleAssignmentId))
 
-    @HistoryClass.UpdateTimestamp
     def ChangeEmail(self, newEmail: str) -> None:
         """
         Change the user's email and emit a UserEmailChanged event.
@@ -560,20 +565,22 @@ class User(HistoryClass, EventEmitter):
         if self.email == newEmail:
             return
 
-        if not re.match(r"[^@]+@[^@]+\.[^@]+", newEmail):
+        if not _EMAIL_RE.match(newEmail):
             raise ValueError("Invalid email format")
 
         self.email = newEmail
+        self.updatedAt = UtcNow()
         # Emit event for changing email
         # self.EmitEvent(UserEmailChanged.FromModel(self))
 
-    @HistoryClass.UpdateTimestamp
     def ClearRoleAssignments(self) -> None:
         """
         Clear all role assignments from the user and emit a RoleAssignmentsCleared event.
         """
 
-        self.roleAssignments = []
+        self.roleAssignments.clear()
+        self._roleIndex.clear()
+        self.updatedAt = UtcNow()
         # Emit event for clearing role assignments
         # self.EmitEvent(RoleAssignmentsCleared.FromModel(self))
 
@@ -592,7 +599,7 @@ class AuthenticationCode(HistoryClass, EventEmitter):
     userId: UUID = Field(default_factory=UUID)
     clientId: UUID = Field(default_factory=UUID)
     scopes: List[str] = Field(default_factory=list)
-    expiresAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    expiresAt: datetime = Field(default_factory=UtcNow)
     codeChallenge: Optional[str] = None
 
     @classmethod
@@ -605,7 +612,7 @@ class AuthenticationCode(HistoryClass, EventEmitter):
         expiresAt: datetime,
         codeChallenge: Optional[str] = None,
     ) -> "AuthenticationCode":
-        id: UUID = uuid4()
+        id: UUID = Uuid7()
 
         authenticationCode = cls(
             id=id,
@@ -615,8 +622,6 @@ class AuthenticationCode(HistoryClass, EventEmitter):
             scopes=scopes,
             expiresAt=expiresAt,
             codeChallenge=codeChallenge,
-            createdAt=datetime.now(timezone.utc),
-            updatedAt=datetime.now(timezone.utc),
         )
 
         # Emit event for creation if needed
@@ -627,14 +632,12 @@ class AuthenticationCode(HistoryClass, EventEmitter):
     @classmethod
     def FromDatabase(cls, data: Dict[str, Any]) -> "AuthenticationCode":
         return cls(
-            id=data["id"] if isinstance(data["id"], UUID) else UUID(data["id"]),
+            id=AsUuid(data["id"]),
             code=data["code"],
-            userId=data["userId"] if isinstance(data["userId"], UUID) else UUID(data["userId"]),
-            clientId=(
-                data["clientId"] if isinstance(data["clientId"], UUID) else UUID(data["clientId"])
-            ),
+            userId=AsUuid(data["userId"]),
+            clientId=AsUuid(data["clientId"]),
             scopes=data.get("scopes", []),
-            expiresAt=datetime.fromisoformat(data["expiresAt"]),
+            expiresAt=AsDatetime(data["expiresAt"]),
             codeChallenge=data.get("codeChallenge"),
         )
 
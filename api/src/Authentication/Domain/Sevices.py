@@ -1,37 +1,37 @@
 import secrets
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta
 from typing import List, Optional
 from uuid import UUID
 from src.Authentication.Domain.Interfaces import IUserRepository
 from src.Shared.Config.AppConfig import AppConfig
 from src.Authentication.Domain.Models import AuthenticationCode
+from src.Shared.Models import UtcNow
 
 
 class UniquenessService:
     def __init__(self, userRepository: IUserRepository):
         self.userRepository = userRepository
 
-    def ValidateIsEmailUnique(self, email: str) -> None:
-        if self.userRepository.FindByEmail(email) is not None:
+    def ValidateUnique(self, email: str, username: str) -> None:
+        # Both checks in one round-trip; a taken email is reported before a taken username
+        emailTaken, usernameTaken = self.userRepository.ExistsByEmailOrUsername(email, username)
+        if emailTaken:
             raise ValueError("Email already in use")
-
-    def ValidateIsUsernameUnique(self, username: str) -> None:
-        if self.userRepository.FindByUsername(username) is not None:
+        if usernameTaken:
             raise ValueError("Username already in use")
 
 
 class AuthenticationCodeService:
     def __init__(self, appConfig: AppConfig):
         self.appConfig = appConfig
+        self.expiryDelta = timedelta(minutes=appConfig.authCodeExpiryMinutes)
 
     def Generate(
         self, userId: UUID, clientId: UUID, scopes: List[str], codeChallenge: Optional[str] = None
     ) -> AuthenticationCode:
         authenticationCode: str = secrets.token_urlsafe(32)
 
-        expiresAt = datetime.now(timezone.utc) + timedelta(
-            minutes=self.appConfig.authCodeExpiryMinutes
-        )
+        expiresAt = UtcNow() + self.expiryDelta
 
         return AuthenticationCode.Create(
             code=authenticationCode,
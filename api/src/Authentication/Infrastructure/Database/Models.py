@@ -12,17 +12,27 @@ from src.Authentication.Domain.Models import (
     Role,
     AuthenticationCode,
 )
+from src.Shared.Constants import (
+    USERS_TABLE,
+    ROLES_TABLE,
+    ROLE_ASSIGNMENTS_TABLE,
+    AUTHENTICATION_CREDENTIALS_TABLE,
+    AUTHENTICATION_CODES_TABLE,
+)
+from src.Shared.Database import RowMixin
 
-Base = declarative_base()
+Base = declarative_base(cls=RowMixin)
 
 
 class AuthenticationCredentialsDatabaseModel(Base):
-    __tablename__ = "t_authentication_credentials"
+    __tablename__ = AUTHENTICATION_CREDENTIALS_TABLE
 
     id: Mapped[UUID] = mapped_column(
-        PG_UUID(as_uuid=True), primary_key=True, default=sa.text("gen_random_uuid()")
+        PG_UUID(as_uuid=True), primary_key=True, default=sa.text("uuidv7()")
+    )
+    userId: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True), sa.ForeignKey(f"{USERS_TABLE}.id"), index=True
     )
-    userId: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), sa.ForeignKey("t_users.id"))
     username: Mapped[str] = mapped_column(sa.String, unique=True, nullable=False)
     passwordHash: Mapped[str] = mapped_column(sa.String, nullable=False)
     mfaEnabled: Mapped[bool] = mapped_column(sa.Boolean, default=False)
@@ -36,38 +46,30 @@ class AuthenticationCredentialsDatabaseModel(Base):
 
     @classmethod
     def FromModel(cls, model: AuthenticationCredentials):
-        return cls(
-            id=model.id,
-            userId=model.userId,
-            username=model.username,
-            passwordHash=model.passwordHash,
-            mfaEnabled=model.mfaEnabled,
-            mfaSecret=model.mfaSecret,
-            createdAt=model.createdAt,
-            updatedAt=model.updatedAt,
-        )
+        return cls(**cls.RowFromModel(model))
 
-    def ToModel(self) -> AuthenticationCredentials:
-        return AuthenticationCredentials.FromDatabase(self.ToDict())
-
-    def ToDict(self) -> dict:
+    @classmethod
+    def RowFromModel(cls, model: AuthenticationCredentials) -> dict:
         return {
-            "id": str(self.id),
-            "userId": str(self.userId),
-            "username": self.username,
-            "passwordHash": self.passwordHash,
-            "mfaEnabled": self.mfaEnabled,
-            "mfaSecret": self.mfaSecret,
-            "createdAt": self.createdAt.isoformat(),
-            "updatedAt": self.updatedAt.isoformat(),
+            "id": model.id,
+            "userId": model.userId,
+            "username": model.username,
+            "passwordHash": model.passwordHash,
+            "mfaEnabled": model.mfaEnabled,
+            "mfaSecret": model.mfaSecret,
+            "createdAt": model.createdAt,
+            "updatedAt": model.updatedAt,
         }
 
+    def ToModel(self) -> AuthenticationCredentials:
+        return AuthenticationCredentials.FromDatabase(self.ToRow())
+
 
 class RoleDatabaseModel(Base):
-    __tablename__ = "t_roles"
+    __tablename__ = ROLES_TABLE
 
     id: Mapped[UUID] = mapped_column(
-        PG_UUID(as_uuid=True), primary_key=True, default=sa.text("gen_random_uuid()")
+        PG_UUID(as_uuid=True), primary_key=True, default=sa.text("uuidv7()")
     )
     name: Mapped[str] = mapped_column(sa.String, unique=True, nullable=False)
     description: Mapped[str] = mapped_column(sa.String, nullable=True)
@@ -89,26 +91,21 @@ class RoleDatabaseModel(Base):
         )
 
     def ToModel(self) -> Role:
-        return Role.FromDatabase(self.ToDict())
-
-    def ToDict(self) -> dict:
-        return {
-            "id": str(self.id),
-            "name": self.name,
-            "description": self.description,
-            "createdAt": self.createdAt.isoformat(),
-            "updatedAt": self.updatedAt.isoformat(),
-        }
+        return Role.FromDatabase(self.ToRow())
 
 
 class RoleAssignmentDatabaseModel(Base):
-    __tablename__ = "t_role_assignments"
+    __tablename__ = ROLE_ASSIGNMENTS_TABLE
 
     id: Mapped[UUID] = mapped_column(
-        PG_UUID(as_uuid=True), primary_key=True, default=sa.text("gen_random_uuid()")
+        PG_UUID(as_uuid=True), primary_key=True, default=sa.text("uuidv7()")
+    )
+    userId: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True), sa.ForeignKey(f"{USERS_TABLE}.id"), index=True
+    )
+    roleId: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True), sa.ForeignKey(f"{ROLES_TABLE}.id"), index=True
     )
-    userId: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), sa.ForeignKey("t_users.id"))
-    roleId: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), sa.ForeignKey("t_roles.id"))
     createdAt: Mapped[datetime] = mapped_column(
         sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")
     )
@@ -118,32 +115,31 @@ class RoleAssignmentDatabaseModel(Base):
 
     @classmethod
     def FromModel(cls, model: RoleAssignment):
-        return cls(
-            id=model.id,
-            userId=model.userId,
-            roleId=model.roleId,
-            createdAt=model.createdAt,
-            updatedAt=model.updatedAt,
-        )
+        return cls(**cls.RowFromModel(model))
 
-    def ToModel(self) -> RoleAssignment:
-        return RoleAssignment.FromDatabase(self.ToDict())
-
-    def ToDict(self) -> dict:
+    @classmethod
+    def RowFromModel(cls, model: RoleAssignment) -> dict:
         return {
-            "id": str(self.id),
-            "userId": str(self.userId),
-            "roleId": str(self.roleId),
-            "createdAt": self.createdAt.isoformat(),
-            "updatedAt": self.updatedAt.isoformat(),
+            "id": model.id,
+            "userId": model.userId,
+            "roleId": model.roleId,
+            "createdAt": model.createdAt,
+            "updatedAt": model.updatedAt,
         }
 
+    def ToModel(self) -> RoleAssignment:
+        return RoleAssignment.FromDatabase(self.ToRow())
+
 
 class UserDatabaseModel(Base):
-    __tablename__ = "t_users"
+    __tablename__ = USERS_TABLE
+    __table_args__ = (
+        sa.Index("ix_users_created_id", "createdAt", "id"),
+        sa.Index("ix_users_updated_id", "updatedAt", "id"),
+    )
 
     id: MappedColumn[UUID] = mapped_column(
-        PG_UUID(as_uuid=True), primary_key=True, default=sa.text("gen_random_uuid()")
+        PG_UUID(as_uuid=True), primary_key=True, default=sa.text("uuidv7()")
     )
     email: MappedColumn[str] = mapped_column(sa.String, unique=True, nullable=False)
     isActive: MappedColumn[bool] = mapped_column(sa.Boolean, default=True)
@@ -158,17 +154,13 @@ class UserDatabaseModel(Base):
     authenticationCredentials = relationship(
         "AuthenticationCredentialsDatabaseModel", uselist=False, lazy="joined"
     )
-    roleAssignments = relationship("RoleAssignmentDatabaseModel", lazy="joined")
+    # Loaded with a second IN query rather than a join that repeats the user row per assignment
+    roleAssignments = relationship("RoleAssignmentDatabaseModel", lazy="selectin")
 
     @classmethod
     def FromModel(cls, model: User):
         return cls(
-            id=model.id,
-            email=model.email,
-            isActive=model.isActive,
-            isVerified=model.isVerified,
-            createdAt=model.createdAt,
-            updatedAt=model.updatedAt,
+            **cls.RowFromModel(model),
             authenticationCredentials=AuthenticationCredentialsDatabaseModel.FromModel(
                 model.authenticationCredentials
             ),
@@ -177,32 +169,49 @@ class UserDatabaseModel(Base):
             ],
         )
 
-    def ToModel(self) -> User:
-        return User.FromDatabase(self.ToDict())
-
-    def ToDict(self) -> dict:
+    @classmethod
+    def RowFromModel(cls, model: User) -> dict:
         return {
-            "id": str(self.id),
-            "email": self.email,
-            "isActive": self.isActive,
-            "isVerified": self.isVerified,
-            "createdAt": self.createdAt.isoformat(),
-            "updatedAt": self.updatedAt.isoformat(),
-            "authenticationCredentials": self.authenticationCredentials.ToDict(),
-            "roleAssignments": [ra.ToDict() for ra in self.roleAssignments],
+            "id": model.id,
+            "email": model.email,
+            "isActive": model.isActive,
+            "isVerified": model.isVerified,
+            "createdAt": model.createdAt,
+            "updatedAt": model.updatedAt,
         }
 
+    def ToModel(self) -> User:
+        return User.FromDatabase(
+            {
+                **self.ToRow(),
+                "authenticationCredentials": self.authenticationCredentials.ToRow(),
+                "roleAssignments": [ra.ToRow() for ra in self.roleAssignments],
+            }
+        )
+
 
 class AuthenticationCodeDatabaseModel(Base):
-    __tablename__ = "t_authentication_codes"
+    __tablename__ = AUTHENTICATION_CODES_TABLE
+    __table_args__ = (
+        sa.Index(
+            "ix_authcodes_code_incl",
+            "code",
+            unique=True,
+            postgresql_include=["expiresAt", "userId", "clientId", "codeChallenge", "scopes"],
+        ),
+    )
 
     id: MappedColumn[UUID] = mapped_column(
-        PG_UUID(as_uuid=True), primary_key=True, default=sa.text("gen_random_uuid()")
+        PG_UUID(as_uuid=True), primary_key=True, default=sa.text("uuidv7()")
+    )
+    code: MappedColumn[str] = mapped_column(sa.String, nullable=False)
+    userId: MappedColumn[UUID] = mapped_column(
+        PG_UUID(as_uuid=True), sa.ForeignKey(f"{USERS_TABLE}.id"), index=True
     )
-    code: MappedColumn[str] = mapped_column(sa.String, unique=True, nullable=False)
-    userId: MappedColumn[UUID] = mapped_column(PG_UUID(as_uuid=True), sa.ForeignKey("t_users.id"))
     clientId: MappedColumn[UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False)
-    scopes: MappedColumn[str] = mapped_column(sa.String, nullable=True)  # Comma-separated scopes
+    scopes: MappedColumn[list[str]] = mapped_column(
+        sa.ARRAY(sa.String), nullable=False, default=[], server_default=sa.text("'{}'")
+    )
     codeChallenge: MappedColumn[str] = mapped_column(sa.String, nullable=True)
     expiresAt: MappedColumn[datetime] = mapped_column(sa.DateTime(timezone=True), nullable=False)
     createdAt: MappedColumn[datetime] = mapped_column(
@@ -214,30 +223,21 @@ class AuthenticationCodeDatabaseModel(Base):
 
     @classmethod
     def FromModel(cls, model: AuthenticationCode):
-        return cls(
-            id=model.id,
-            code=model.code,
-            userId=model.userId,
-            clientId=model.clientId,
-            scopes=",".join(model.scopes) if model.scopes else None,
-            codeChallenge=model.codeChallenge,
-            expiresAt=model.expiresAt,
-            createdAt=model.createdAt,
-            updatedAt=model.updatedAt,
-        )
-
-    def ToModel(self) -> AuthenticationCode:
-        return AuthenticationCode.FromDatabase(self.ToDict())
+        return cls(**cls.RowFromModel(model))
 
-    def ToDict(self) -> dict:
+    @classmethod
+    def RowFromModel(cls, model: AuthenticationCode) -> dict:
         return {
-            "id": str(self.id),
-            "code": self.code,
-            "userId": str(self.userId),
-            "clientId": str(self.clientId),
-            "scopes": self.scopes.split(",") if self.scopes else [],
-            "codeChallenge": self.codeChallenge,
-            "expiresAt": self.expiresAt.isoformat(),
-            "createdAt": self.createdAt.isoformat(),
-            "updatedAt": self.updatedAt.isoformat(),
+            "id": model.id,
+            "code": model.code,
+            "userId": model.userId,
+            "clientId": model.clientId,
+            "scopes": model.scopes,
+            "codeChallenge": model.codeChallenge,
+            "expiresAt": model.expiresAt,
+            "createdAt": model.createdAt,
+            "updatedAt": model.updatedAt,
         }
+
+    def ToModel(self) -> AuthenticationCode:
+        return AuthenticationCode.FromDatabase(self.ToRow())
@@ -1,9 +1,14 @@
+from collections import defaultdict
+from typing import Any, Optional, Tuple
 from uuid import UUID
 import sqlalchemy as sa
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import (
     Session as DatabaseSession,
+    contains_eager,
     joinedload,
+    raiseload,
+    selectinload,
 )
 from src.Authentication.Domain.Interfaces import IUserRepository, IAuthCodeRepository
 from src.Authentication.Domain.Models import AuthenticationCode, User
@@ -11,6 +16,50 @@ from src.Authentication.Infrastructure.Database.Models import (
     UserDatabaseModel,
     AuthenticationCredentialsDatabaseModel,
     AuthenticationCodeDatabaseModel,
+    RoleAssignmentDatabaseModel,
+)
+from src.Shared.Database import Upsert
+
+# Sortable columns of the user listing, resolved once instead of on every call
+USER_SORT_COLUMNS = {
+    **{key: getattr(UserDatabaseModel, key) for key in UserDatabaseModel.__table__.columns.keys()},
+    "username": AuthenticationCredentialsDatabaseModel.username,
+}
+
+# Lookup statements are built once and executed with fresh parameters, so each call skips
+# constructing the select and regenerating its cache key before hitting the compiled cache
+SELECT_USER = sa.select(UserDatabaseModel).options(
+    joinedload(UserDatabaseModel.authenticationCredentials),
+    selectinload(UserDatabaseModel.roleAssignments),
+    raiseload("*"),
+)
+FIND_USER_BY_ID = SELECT_USER.where(UserDatabaseModel.id == sa.bindparam("id"))
+FIND_USER_BY_EMAIL = SELECT_USER.where(UserDatabaseModel.email == sa.bindparam("email"))
+# The credentials join used for filtering also fills the relationship, instead of a second join
+FIND_USER_BY_USERNAME = (
+    sa.select(UserDatabaseModel)
+    .join(UserDatabaseModel.authenticationCredentials)
+    .options(
+        contains_eager(UserDatabaseModel.authenticationCredentials),
+        selectinload(UserDatabaseModel.roleAssignments),
+        raiseload("*"),
+    )
+    .where(AuthenticationCredentialsDatabaseModel.username == sa.bindparam("username"))
+)
+# Two EXISTS probes on the unique indexes, answered in a single round-trip
+EXISTS_USER_BY_EMAIL_OR_USERNAME = sa.select(
+    sa.exists().where(UserDatabaseModel.email == sa.bindparam("email")),
+    sa.exists().where(AuthenticationCredentialsDatabaseModel.username == sa.bindparam("username")),
+)
+# Upserts only touch the assignments a user still has, so the ones removed from it are deleted
+DELETE_REMOVED_ROLE_ASSIGNMENTS = sa.delete(RoleAssignmentDatabaseModel).where(
+    RoleAssignmentDatabaseModel.userId == sa.bindparam("userId"),
+    RoleAssignmentDatabaseModel.id.not_in(sa.bindparam("keptIds", expanding=True)),
+)
+FIND_AUTH_CODE_BY_CODE = (
+    sa.select(AuthenticationCodeDatabaseModel)
+    .options(raiseload("*"))
+    .where(AuthenticationCodeDatabaseModel.code == sa.bindparam("code"))
 )
 
 
@@ -19,75 +68,107 @@ class SqlUserRepository(IUserRepository):
         self.session = session
 
     def FindById(self, id: UUID) -> User | None:
-        stmt = (
-            sa.select(UserDatabaseModel)
-            .options(
-                joinedload(UserDatabaseModel.authenticationCredentials),
-                joinedload(UserDatabaseModel.roleAssignments),
-            )
-            .where(UserDatabaseModel.id == id)
-        )
-        dbUser = self.session.execute(stmt).unique().scalar_one_or_none()
+        dbUser = self.session.execute(FIND_USER_BY_ID, {"id": id}).scalar_one_or_none()
         return dbUser.ToModel() if dbUser else None
 
     def FindByEmail(self, email: str) -> User | None:
-        stmt = (
-            sa.select(UserDatabaseModel)
-            .options(
-                joinedload(UserDatabaseModel.authenticationCredentials),
-                joinedload(UserDatabaseModel.roleAssignments),
-            )
-            .where(UserDatabaseModel.email == email)
-        )
-        dbUser = self.session.execute(stmt).unique().scalar_one_or_none()
+        dbUser = self.session.execute(FIND_USER_BY_EMAIL, {"email": email}).scalar_one_or_none()
         return dbUser.ToModel() if dbUser else None
 
     def FindByUsername(self, username: str) -> User | None:
-        stmt = (
-            sa.select(UserDatabaseModel)
-            .options(
-                joinedload(UserDatabaseModel.authenticationCredentials),
-                joinedload(UserDatabaseModel.roleAssignments),
-            )
-            .join(UserDatabaseModel.authenticationCredentials)
-            .where(AuthenticationCredentialsDatabaseModel.username == username)
-        )
-        dbUser = self.session.execute(stmt).unique().scalar_one_or_none()
+        dbUser = self.session.execute(
+            FIND_USER_BY_USERNAME, {"username": username}
+        ).scalar_one_or_none()
         return dbUser.ToModel() if dbUser else None
 
+    def ExistsByEmailOrUsername(self, email: str, username: str) -> Tuple[bool, bool]:
+        emailTaken, usernameTaken = self.session.execute(
+            EXISTS_USER_BY_EMAIL_OR_USERNAME, {"email": email, "username": username}
+        ).one()
+        return emailTaken, usernameTaken
+
     def ListAll(
-        self, sortBy: str = "email", sortOrder: str = "asc", limit: int = 100, offset: int = 0
+        self,
+        sortBy: str = "email",
+        sortOrder: str = "asc",
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[Tuple[Any, UUID]] = None,
     ) -> list[User]:
-        if sortBy not in UserDatabaseModel.__table__.columns.keys():
-            sortBy = "email"
+        # Users, credentials and role assignments in three queries, whatever the page size
+        stmt = self._SelectUsersPage(sortBy, sortOrder, limit, offset, after)
+        dbUsers = self.session.execute(stmt).scalars().all()
+        if not dbUsers:
+            return []
+        userIds = [dbUser.id for dbUser in dbUsers]
+
+        credentialsStmt = sa.select(AuthenticationCredentialsDatabaseModel).where(
+            AuthenticationCredentialsDatabaseModel.userId.in_(userIds)
+        )
+        credentialsByUserId = {
+            dbCredentials.userId: dbCredentials.ToRow()
+            for dbCredentials in self.session.execute(credentialsStmt).scalars()
+        }
+
+        roleAssignmentsStmt = sa.select(RoleAssignmentDatabaseModel).where(
+            RoleAssignmentDatabaseModel.userId.in_(userIds)
+        )
+        roleAssignmentsByUserId: dict[UUID, list[dict]] = defaultdict(list)
+        for dbRoleAssignment in self.session.execute(roleAssignmentsStmt).scalars():
+            roleAssignmentsByUserId[dbRoleAssignment.userId].append(dbRoleAssignment.ToRow())
 
-        sortColumn = getattr(UserDatabaseModel, sortBy)
-        sortColumn = sortColumn.desc() if sortOrder.lower() == "desc" else sortColumn.asc()
+        return User.FromDatabaseBatch(
+            [dbUser.ToRow() for dbUser in dbUsers],
+            credentialsByUserId,
+            roleAssignmentsByUserId,
+        )
+
+    @staticmethod
+    def _SelectUsersPage(
+        sortBy: str, sortOrder: str, limit: int, offset: int, after: Optional[Tuple[Any, UUID]]
+    ) -> sa.Select:
+        stmt = sa.select(UserDatabaseModel).options(raiseload("*"))
+        sortColumn = USER_SORT_COLUMNS.get(sortBy, UserDatabaseModel.email)
+        if sortBy == "username":
+            stmt = stmt.join(AuthenticationCredentialsDatabaseModel)
+        descending = sortOrder.lower() == "desc"
+
+        # Keyset pagination: seek past the previous page through the index instead of
+        # scanning and discarding every earlier row; the id breaks ties in the sort value
+        if after is not None:
+            sortKey = sa.tuple_(sortColumn, UserDatabaseModel.id)
+            stmt = stmt.where(sortKey < after if descending else sortKey > after)
 
-        stmt = (
-            sa.select(UserDatabaseModel)
-            .options(
-                joinedload(UserDatabaseModel.authenticationCredentials),
-                joinedload(UserDatabaseModel.roleAssignments),
+        return (
+            stmt.order_by(
+                *(
+                    column.desc() if descending else column.asc()
+                    for column in (sortColumn, UserDatabaseModel.id)
+                )
             )
-            .order_by(sortColumn)
             .limit(limit)
             .offset(offset)
         )
-        dbUsers = self.session.execute(stmt).scalars().unique().all()
-        return [dbUser.ToModel() for dbUser in dbUsers]
 
     def Save(self, user: User) -> None:
-        dbUser = UserDatabaseModel.FromModel(user)
+        # One upsert per table instead of merge's SELECTs to find out whether the rows exist
+        credentialsRow = AuthenticationCredentialsDatabaseModel.RowFromModel(
+            user.authenticationCredentials
+        )
+        roleAssignmentRows = [
+            RoleAssignmentDatabaseModel.RowFromModel(ra) for ra in user.roleAssignments
+        ]
         try:
-            self.session.merge(dbUser)  # replaces update+add
-            self.session.commit()
+            self.session.execute(Upsert(UserDatabaseModel, [UserDatabaseModel.RowFromModel(user)]))
+            self.session.execute(Upsert(AuthenticationCredentialsDatabaseModel, [credentialsRow]))
+            self.session.execute(
+                DELETE_REMOVED_ROLE_ASSIGNMENTS,
+                {"userId": user.id, "keptIds": [row["id"] for row in roleAssignmentRows]},
+            )
+            if roleAssignmentRows:
+                self.session.execute(Upsert(RoleAssignmentDatabaseModel, roleAssignmentRows))
         except IntegrityError as e:
-            self.session.rollback()
             raise ValueError("User with given email or username already exists.") from e
-        except Exception as e:
-            self.session.rollback()
-            raise e
 
 
 class SqlAuthCodeRepository(IAuthCodeRepository):
@@ -95,20 +176,12 @@ class SqlAuthCodeRepository(IAuthCodeRepository):
         self.session = session
 
     def FindByCode(self, code: str) -> AuthenticationCode | None:
-        stmt = sa.select(AuthenticationCodeDatabaseModel).where(
-            AuthenticationCodeDatabaseModel.code == code
-        )
-        dbCode = self.session.execute(stmt).unique().scalar_one_or_none()
+        dbCode = self.session.execute(FIND_AUTH_CODE_BY_CODE, {"code": code}).scalar_one_or_none()
         return dbCode.ToModel() if dbCode else None
 
     def Save(self, authenticationCode: AuthenticationCode) -> None:
-        dbCode = AuthenticationCodeDatabaseModel.FromModel(authenticationCode)
+        row = AuthenticationCodeDatabaseModel.RowFromModel(authenticationCode)
         try:
-            self.session.merge(dbCode)
-            self.session.commit()
+            self.session.execute(Upsert(AuthenticationCodeDatabaseModel, [row]))
         except IntegrityError as e:
-            self.session.rollback()
             raise ValueError("Authentication code already exists.") from e
-        except Exception as e:
-            self.session.rollback()
-            raise e
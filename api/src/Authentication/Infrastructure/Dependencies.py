@@ -20,6 +20,7 @@ from src.Authentication.Application.RegisterUser import RegisterUserHandler
 from src.Authentication.Application.Authenticate import AuthenticateHandler
 from src.Shared.Logging.Interfaces import ILogger
 from src.Shared.Events.Models import EventDispatcher
+from src.Shared.UnitOfWork.Interfaces import IUnitOfWork
 from src.Session.Application.CreateSession import CreateSessionHandler
 from src.Session.Application.ValidateSession import ValidateSessionHandler
 
@@ -27,6 +28,12 @@ from src.Session.Application.ValidateSession import ValidateSessionHandler
 class AuthenticationDependencies:
     @classmethod
     def RegisterDependencies(cls, container: Container):
+        container.RegisterSingletons(
+            {
+                # Stateless, so one instance is shared instead of being rebuilt per resolution
+                IHashingService.__name__: lambda container: BcryptHashingService(),
+            }
+        )
         container.RegisterFactories(
             {
                 # Repositories
@@ -37,7 +44,6 @@ class AuthenticationDependencies:
                     session=container.Get(DatabaseSession.__name__)
                 ),
                 # Services
-                IHashingService.__name__: lambda container: BcryptHashingService(),
                 ISessionService.__name__: lambda container: SessionService(
                     createSessionHandler=container.Get(CreateSessionHandler.__name__),
                     validateSessionHandler=container.Get(ValidateSessionHandler.__name__),
@@ -55,6 +61,7 @@ class AuthenticationDependencies:
                     ),
                     logger=container.Get(ILogger.__name__),
                     eventDispatcher=container.Get(EventDispatcher.__name__),
+                    unitOfWork=container.Get(IUnitOfWork.__name__),
                 ),
                 AuthenticateHandler.__name__: lambda container: AuthenticateHandler(
                     userRepository=container.Get(IUserRepository.__name__),
@@ -66,6 +73,7 @@ class AuthenticationDependencies:
                     sessionService=container.Get(ISessionService.__name__),
                     eventDispatcher=container.Get(EventDispatcher.__name__),
                     logger=container.Get(ILogger.__name__),
+                    unitOfWork=container.Get(IUnitOfWork.__name__),
                 ),
                 # Controller
                 AuthenticationController.__name__: lambda container: AuthenticationController(
@@ -15,6 +15,7 @@ from src.Authentication.Application.Authenticate import (
     AuthenticateCommand,
 )
 
+from src.Shared.Enums import LogLevelEnum
 from src.Shared.Logging.Interfaces import ILogger
 
 
@@ -33,7 +34,8 @@ class AuthenticationController:
 
     def ListAllUsers(self, command: Optional[ListAllUsersCommand] = None):
         try:
-            self.logger.Info(f"Listing all users with command: {command}")
+            if self.logger.IsEnabled(LogLevelEnum.INFO):
+                self.logger.Info(f"Listing all users with command: {command}")
             return self.listAllUsersHandler.Handle(command)
         except Exception as e:
             self.logger.Error(f"Error listing users: {e}")
@@ -41,7 +43,8 @@ class AuthenticationController:
 
     def RegisterUser(self, command: RegisterUserCommand):
         try:
-            self.logger.Info(f"Registering user with command: {command}")
+            if self.logger.IsEnabled(LogLevelEnum.INFO):
+                self.logger.Info(f"Registering user with command: {command}")
             return self.registerUserHandler.Handle(command)
         except Exception as e:
             self.logger.Error(f"Error registering user: {e}")
@@ -49,7 +52,8 @@ class AuthenticationController:
 
     def Authenticate(self, command: AuthenticateCommand):
         try:
-            self.logger.Info(f"Authenticating user with command: {command}")
+            if self.logger.IsEnabled(LogLevelEnum.INFO):
+                self.logger.Info(f"Authenticating user with command: {command}")
             return self.authenticateHandler.Handle(command)
         except ValueError as ve:
             self.logger.Warning(f"Authentication failed: {ve}")
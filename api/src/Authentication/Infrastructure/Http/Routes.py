@@ -1,22 +1,44 @@
+import hashlib
 from typing import Optional
-from fastapi import APIRouter
+from fastapi import APIRouter, Header, Response, status
+from pydantic_core import to_json
 from src.Authentication.Application.Authenticate import AuthenticateCommand
 from src.Authentication.Infrastructure.Http.Controller import AuthenticationController
-from src.Authentication.Application.ListAllUsers import ListAllUsersCommand
+from src.Authentication.Application.ListAllUsers import ListAllUsersCommand, NextCursor
 from src.Authentication.Application.RegisterUser import RegisterUserCommand
 
 
 class Routes:
     @classmethod
     def RegisterRoutes(cls, router: APIRouter, controller: AuthenticationController):
+        # Routes touching the database or hashing passwords are sync so FastAPI runs them in
+        # its threadpool instead of blocking the event loop; bcrypt and the database driver
+        # release the GIL, so concurrent requests overlap
         @router.get("/users")
-        async def ListAllUsers(command: Optional[ListAllUsersCommand] = None):
-            return controller.ListAllUsers(command)
+        def ListAllUsers(
+            command: Optional[ListAllUsersCommand] = None,
+            ifNoneMatch: Optional[str] = Header(None, alias="If-None-Match"),
+        ):
+            users = controller.ListAllUsers(command)
+            nextCursor = NextCursor(command or ListAllUsersCommand(), users)
+            # Encoded in a single pydantic-core pass, skipping jsonable_encoder and json.dumps
+            content = to_json(users)
+            # Clients polling an unchanged page revalidate and get an empty 304 back; the page
+            # is still read to compute the tag, so this saves the transfer, not the query
+            headers = {
+                "ETag": f'W/"{hashlib.blake2b(content, digest_size=16).hexdigest()}"',
+                "Cache-Control": "private, no-cache",
+            }
+            if nextCursor:
+                headers["X-Next-Cursor"] = nextCursor
+            if ifNoneMatch == headers["ETag"]:
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+            return Response(content=content, media_type="application/json", headers=headers)
 
         @router.post("/users")
-        async def RegisterUser(command: RegisterUserCommand):
+        def RegisterUser(command: RegisterUserCommand):
             return controller.RegisterUser(command)
 
         @router.post("/users/authenticate")
-        async def Authenticate(command: AuthenticateCommand):
+        def Authenticate(command: AuthenticateCommand):
             return controller.Authenticate(command)
@@ -3,7 +3,7 @@ from typing import List
 from src.Authentication.Domain.Interfaces import ISessionService
 from src.Session.Application.CreateSession import CreateSessionHandler, CreateSessionCommand
 from src.Session.Application.ValidateSession import ValidateSessionHandler, ValidateSessionCommand
-from src.Shared.Models import AuthenticationMethod
+from src.Shared.Models import AUTHENTICATION_METHODS, AuthenticationMethod
 from src.Shared.Enums import AuthenticationMethodEnum
 
 
@@ -43,15 +43,14 @@ class SessionService(ISessionService):
         codeChallenge: str,
         authenticationCodeId: UUID | None,
     ) -> UUID:
-        command = CreateSessionCommand(
+        return self.CreateSession(
             userId=userId,
             clientId=clientId,
             scopes=scopes,
             codeChallenge=codeChallenge,
-            authenticationMethod=AuthenticationMethod(value=AuthenticationMethodEnum.PASSWORD),
+            authenticationMethod=AUTHENTICATION_METHODS[AuthenticationMethodEnum.PASSWORD],
             authenticationCodeId=authenticationCodeId,
         )
-        return self.createSessionHandler.Handle(command)
 
     def CreateMFASession(
         self,
@@ -61,15 +60,14 @@ class SessionService(ISessionService):
         codeChallenge: str,
         authenticationCodeId: UUID | None,
     ) -> UUID:
-        command = CreateSessionCommand(
+        return self.CreateSession(
             userId=userId,
             clientId=clientId,
             scopes=scopes,
             codeChallenge=codeChallenge,
-            authenticationMethod=AuthenticationMethod(value=AuthenticationMethodEnum.MFA),
+            authenticationMethod=AUTHENTICATION_METHODS[AuthenticationMethodEnum.MFA],
             authenticationCodeId=authenticationCodeId,
         )
-        return self.createSessionHandler.Handle(command)
 
     def ValidateSession(
         self,
@@ -1,10 +1,12 @@
-from uuid import UUID, uuid4
+from uuid import UUID
 from typing import Optional, List
-from pydantic import BaseModel, Field, field_validator
-from src.Shared.Enums import AuthenticationMethodEnum
-from src.Shared.Models import AuthenticationMethod
+from pydantic import BaseModel, Field
+from src.Shared.Identifiers import Uuid7
+from src.Shared.Models import AuthenticationMethodField
+from src.Shared.Enums import LogLevelEnum
 from src.Shared.Logging.Interfaces import ILogger
 from src.Shared.Events.Models import EventDispatcher
+from src.Shared.UnitOfWork.Interfaces import IUnitOfWork
 from src.Session.Domain.Interfaces import ISessionRepository
 from src.Session.Domain.Models import Session
 
@@ -14,16 +16,9 @@ class CreateSessionCommand(BaseModel):
     clientId: UUID = Field(...)
     scopes: List[str] = Field(default_factory=list)
     codeChallenge: str = Field(...)
-    authenticationMethod: AuthenticationMethod = Field(...)
+    authenticationMethod: AuthenticationMethodField = Field(...)
     authenticationCodeId: Optional[UUID] = Field(None)
 
-    @field_validator("authenticationMethod", mode="before")
-    @classmethod
-    def ValidateAuthenticationMethod(cls, v):
-        if isinstance(v, str):
-            return AuthenticationMethod(value=AuthenticationMethodEnum(v))
-        return v
-
 
 class CreateSessionHandler:
     def __init__(
@@ -31,15 +26,17 @@ class CreateSessionHandler:
         sessionRepository: ISessionRepository,
         eventDispatcher: EventDispatcher,
         logger: ILogger,
+        unitOfWork: IUnitOfWork,
     ):
         self.sessionRepository = sessionRepository
         self.eventDispatcher = eventDispatcher
         self.logger = logger
+        self.unitOfWork = unitOfWork
 
     def Handle(self, command: CreateSessionCommand) -> UUID:
         # Create a new session instance
         session = Session.Create(
-            id=uuid4(),
+            id=Uuid7(),
             userId=command.userId,
             clientId=command.clientId,
             scopes=command.scopes,
@@ -49,10 +46,12 @@ class CreateSessionHandler:
         )
 
         # Save the session to the repository
-        self.sessionRepository.Save(session)
+        with self.unitOfWork:
+            self.sessionRepository.Save(session)
 
         # Dispatch any events associated with the session creation
         self.eventDispatcher.DispatchAll(session.ReleaseEvents())
 
-        self.logger.Info(f"Session created successfully: {session.id}")
+        if self.logger.IsEnabled(LogLevelEnum.INFO):
+            self.logger.Info(f"Session created successfully: {session.id}")
         return session.id
@@ -1,13 +1,13 @@
 from uuid import UUID
 from typing import List, Optional
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
 from src.Session.Domain.Interfaces import ISessionRepository
-from src.Shared.Enums import AuthenticationMethodEnum
+from src.Shared.Enums import LogLevelEnum
 from src.Shared.Logging.Interfaces import ILogger
 from src.Session.Domain.Models import Session
 from src.Session.Domain.Services import SessionValidationService
 from src.Shared.Events.Models import EventDispatcher
-from src.Shared.Models import AuthenticationMethod
+from src.Shared.Models import AuthenticationMethodField
 
 
 class ValidateSessionCommand(BaseModel):
@@ -16,14 +16,7 @@ class ValidateSessionCommand(BaseModel):
     requiredScopes: List[str] = Field(default_factory=list)
     clientId: UUID = Field(...)
     codeChallenge: str = Field(min_length=43, max_length=128)
-    authenticationMethod: AuthenticationMethod = Field(...)
-
-    @field_validator("authenticationMethod", mode="before")
-    @classmethod
-    def ValidateAuthenticationMethod(cls, v):
-        if isinstance(v, str):
-            return AuthenticationMethod(value=AuthenticationMethodEnum(v))
-        return v
+    authenticationMethod: AuthenticationMethodField = Field(...)
 
 
 class ValidateSessionHandler:
@@ -57,4 +50,5 @@ class ValidateSessionHandler:
             command.authenticationMethod.value,
         )
 
-        self.logger.Info(f"Session validated successfully: {command.sessionId}")
+        if self.logger.IsEnabled(LogLevelEnum.INFO):
+            self.logger.Info(f"Session validated successfully: {command.sessionId}")
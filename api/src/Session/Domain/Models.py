@@ -1,8 +1,9 @@
 from uuid import UUID
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Any, Dict, List, Optional
 from pydantic import Field
-from src.Shared.Models import HistoryClass
+from src.Shared.Identifiers import AsUuid
+from src.Shared.Models import AsAuthenticationMethod, AsDatetime, HistoryClass, UtcNow
 from src.Shared.Events.Models import EventEmitter
 from src.Shared.Models import AuthenticationMethod
 
@@ -45,17 +46,20 @@ class Session(HistoryClass, EventEmitter):
 
     @classmethod
     def FromDatabase(cls, data: Dict[str, Any]) -> "Session":
-        return cls(
-            id=data["id"],
-            userId=data["userId"],
-            clientId=data["clientId"],
-            scopes=data.get("scopes", []),
+        # Trusted database data, so validation is skipped
+        return cls.model_construct(
+            id=AsUuid(data["id"]),
+            userId=AsUuid(data["userId"]),
+            clientId=AsUuid(data["clientId"]),
+            scopes=data.get("scopes") or [],
             codeChallenge=data["codeChallenge"],
-            authenticationMethod=AuthenticationMethod(value=data["authenticationMethod"]),
-            authenticationCodeId=data.get("authenticationCodeId"),
-            expiresAt=data.get("expiresAt"),
-            createdAt=datetime.fromisoformat(data["createdAt"]),
-            updatedAt=datetime.fromisoformat(data["updatedAt"]),
+            authenticationMethod=AsAuthenticationMethod(data["authenticationMethod"]),
+            authenticationCodeId=(
+                AsUuid(data["authenticationCodeId"]) if data.get("authenticationCodeId") else None
+            ),
+            expiresAt=AsDatetime(data["expiresAt"]) if data.get("expiresAt") else None,
+            createdAt=AsDatetime(data["createdAt"]),
+            updatedAt=AsDatetime(data["updatedAt"]),
         )
 
     def ToDict(self) -> Dict[str, Any]:
@@ -78,25 +82,27 @@ class Session(HistoryClass, EventEmitter):
     def ToDicts(cls, sessions: List["Session"]) -> List[Dict[str, Any]]:
         return [session.ToDict() for session in sessions]
 
-    @HistoryClass.UpdateTimestamp
     def Revoke(self):
-        self.expiresAt = datetime.now(tz=timezone.utc)
+        now = UtcNow()
+        self.expiresAt = now
+        self.updatedAt = now
         # Emit event if needed, e.g., SessionRevoked
         # self.EmitEvent(SessionRevoked.FromModel(self))
 
-    @HistoryClass.UpdateTimestamp
     def RevokeAt(self, expiresAt: datetime):
         self.expiresAt = expiresAt
+        self.updatedAt = UtcNow()
         # Emit event if needed, e.g., SessionRevoked
         # self.EmitEvent(SessionRevoked.FromModel(self))
 
     def IsActive(self) -> bool:
         if self.expiresAt is None:
             return True
-        return self.expiresAt > datetime.now(tz=timezone.utc)
+        return self.expiresAt > UtcNow()
 
     def HasScope(self, scope: str) -> bool:
         return scope in self.scopes
 
     def HasAllScopes(self, requiredScopes: List[str]) -> bool:
-        return all(scope in self.scopes for scope in requiredScopes)
+        # One pass over each list instead of scanning the scopes for every required scope
+        return set(self.scopes).issuperset(requiredScopes)
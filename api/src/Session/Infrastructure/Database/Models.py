@@ -5,15 +5,21 @@ from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column
 import sqlalchemy as sa
 from src.Session.Domain.Models import Session
+from src.Shared.Constants import SESSIONS_TABLE
+from src.Shared.Database import RowMixin
 
-Base = declarative_base()
+Base = declarative_base(cls=RowMixin)
 
 
 class SessionDatabaseModel(Base):
-    __tablename__ = "t_sessions"
+    __tablename__ = SESSIONS_TABLE
+    __table_args__ = (
+        sa.Index("ix_sessions_user_expires", "userId", "expiresAt"),
+        sa.Index("ix_sessions_active", "userId", postgresql_where=sa.text('"expiresAt" IS NULL')),
+    )
 
     id: Mapped[UUID] = mapped_column(
-        PG_UUID(as_uuid=True), primary_key=True, default=sa.text("gen_random_uuid()")
+        PG_UUID(as_uuid=True), primary_key=True, default=sa.text("uuidv7()")
     )
     userId: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True))
     clientId: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True))
@@ -21,7 +27,9 @@ class SessionDatabaseModel(Base):
     codeChallenge: Mapped[str] = mapped_column(sa.String, nullable=False)
     expiresAt: Mapped[datetime | None] = mapped_column(sa.DateTime(timezone=True), nullable=True)
     authenticationMethod: Mapped[str] = mapped_column(sa.String, nullable=False)
-    authenticationCodeId: Mapped[UUID | None] = mapped_column(PG_UUID(as_uuid=True), nullable=True)
+    authenticationCodeId: Mapped[UUID | None] = mapped_column(
+        PG_UUID(as_uuid=True), nullable=True, index=True
+    )
     createdAt: Mapped[datetime] = mapped_column(
         sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")
     )
@@ -31,34 +39,22 @@ class SessionDatabaseModel(Base):
 
     @classmethod
     def FromModel(cls, model: Session):
-        return cls(
-            id=model.id,
-            userId=model.userId,
-            clientId=model.clientId,
-            scopes=model.scopes,
-            codeChallenge=model.codeChallenge,
-            expiresAt=model.expiresAt,
-            authenticationMethod=str(model.authenticationMethod),
-            authenticationCodeId=model.authenticationCodeId,
-            createdAt=model.createdAt,
-            updatedAt=model.updatedAt,
-        )
-
-    def ToModel(self) -> Session:
-        return Session.FromDatabase(self.ToDict())
+        return cls(**cls.RowFromModel(model))
 
-    def ToDict(self) -> dict:
+    @classmethod
+    def RowFromModel(cls, model: Session) -> dict:
         return {
-            "id": str(self.id),
-            "userId": str(self.userId),
-            "clientId": str(self.clientId),
-            "scopes": self.scopes,
-            "codeChallenge": self.codeChallenge,
-            "authenticationMethod": self.authenticationMethod,
-            "authenticationCodeId": (
-                str(self.authenticationCodeId) if self.authenticationCodeId else None
-            ),
-            "expiresAt": self.expiresAt.isoformat() if self.expiresAt else None,
-            "createdAt": self.createdAt.isoformat(),
-            "updatedAt": self.updatedAt.isoformat(),
+            "id": model.id,
+            "userId": model.userId,
+            "clientId": model.clientId,
+            "scopes": model.scopes,
+            "codeChallenge": model.codeChallenge,
+            "expiresAt": model.expiresAt,
+            "authenticationMethod": str(model.authenticationMethod),
+            "authenticationCodeId": model.authenticationCodeId,
+            "createdAt": model.createdAt,
+            "updatedAt": model.updatedAt,
         }
+
+    def ToModel(self) -> Session:
+        return Session.FromDatabase(self.ToRow())
@@ -7,6 +7,17 @@ from sqlalchemy.orm import (
 from src.Session.Domain.Interfaces import ISessionRepository
 from src.Session.Domain.Models import Session
 from src.Session.Infrastructure.Database.Models import SessionDatabaseModel
+from src.Shared.Database import Upsert
+
+# Sortable columns of the session listing, resolved once instead of on every call
+SESSION_SORT_COLUMNS = {
+    key: getattr(SessionDatabaseModel, key) for key in SessionDatabaseModel.__table__.columns.keys()
+}
+
+# Reads select the table itself: the rows go straight to Session.FromDatabase, so no ORM
+# instances are built for them. Built once and executed with fresh parameters
+SESSIONS = SessionDatabaseModel.__table__
+FIND_SESSION_BY_ID = sa.select(SESSIONS).where(SESSIONS.c.id == sa.bindparam("id"))
 
 
 class SqlSessionRepository(ISessionRepository):
@@ -16,29 +27,19 @@ class SqlSessionRepository(ISessionRepository):
     def ListAll(
         self, sortBy: str = "createdAt", sortOrder: str = "asc", limit: int = 100, offset: int = 0
     ) -> list[Session]:
-        if sortBy not in SessionDatabaseModel.__table__.columns.keys():
-            sortBy = "createdAt"
-
-        sortColumn = getattr(SessionDatabaseModel, sortBy)
+        sortColumn = SESSION_SORT_COLUMNS.get(sortBy, SessionDatabaseModel.createdAt)
         sortColumn = sortColumn.desc() if sortOrder.lower() == "desc" else sortColumn.asc()
 
-        stmt = sa.select(SessionDatabaseModel).order_by(sortColumn).limit(limit).offset(offset)
-        dbSessions = self.session.execute(stmt).scalars().all()
-        return [dbSession.ToModel() for dbSession in dbSessions]
+        stmt = sa.select(SESSIONS).order_by(sortColumn).limit(limit).offset(offset)
+        return [Session.FromDatabase(row) for row in self.session.execute(stmt).mappings()]
 
     def FindById(self, sessionId: UUID) -> Session | None:
-        stmt = sa.select(SessionDatabaseModel).where(SessionDatabaseModel.id == sessionId)
-        dbSession = self.session.execute(stmt).scalar_one_or_none()
-        return dbSession.ToModel() if dbSession else None
+        row = self.session.execute(FIND_SESSION_BY_ID, {"id": sessionId}).mappings().first()
+        return Session.FromDatabase(row) if row else None
 
     def Save(self, session: Session) -> None:
-        dbSession = SessionDatabaseModel.FromModel(session)
+        row = SessionDatabaseModel.RowFromModel(session)
         try:
-            self.session.merge(dbSession)  # replaces update+add
-            self.session.commit()
+            self.session.execute(Upsert(SessionDatabaseModel, [row]))
         except IntegrityError as e:
-            self.session.rollback()
             raise ValueError("Session with given details already exists.") from e
-        except Exception as e:
-            self.session.rollback()
-            raise e
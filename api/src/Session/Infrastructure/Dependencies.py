@@ -7,6 +7,7 @@ from src.Session.Application.ValidateSession import ValidateSessionHandler
 from src.Session.Infrastructure.Http.Controller import SessionController
 from src.Shared.Logging.Interfaces import ILogger
 from src.Shared.Events.Models import EventDispatcher
+from src.Shared.UnitOfWork.Interfaces import IUnitOfWork
 
 
 class SessionDependencies:
@@ -24,6 +25,7 @@ class SessionDependencies:
                     sessionRepository=container.Get(ISessionRepository.__name__),
                     logger=container.Get(ILogger.__name__),
                     eventDispatcher=container.Get(EventDispatcher.__name__),
+                    unitOfWork=container.Get(IUnitOfWork.__name__),
                 ),
                 ValidateSessionHandler.__name__: lambda container: ValidateSessionHandler(
                     sessionRepository=container.Get(ISessionRepository.__name__),
@@ -1,6 +1,7 @@
 from fastapi import HTTPException
 from src.Session.Application.CreateSession import CreateSessionCommand, CreateSessionHandler
 from src.Session.Application.ValidateSession import ValidateSessionCommand, ValidateSessionHandler
+from src.Shared.Enums import LogLevelEnum
 from src.Shared.Logging.Interfaces import ILogger
 
 
@@ -17,7 +18,8 @@ class SessionController:
 
     def CreateSession(self, command: CreateSessionCommand):
         try:
-            self.logger.Info(f"Creating session with command: {command}")
+            if self.logger.IsEnabled(LogLevelEnum.INFO):
+                self.logger.Info(f"Creating session with command: {command}")
             return self.createSessionHandler.Handle(command)
         except Exception as e:
             self.logger.Error(f"Error creating session: {e}")
@@ -25,7 +27,8 @@ class SessionController:
 
     def ValidateSession(self, command: ValidateSessionCommand):
         try:
-            self.logger.Info(f"Validating session with command: {command}")
+            if self.logger.IsEnabled(LogLevelEnum.INFO):
+                self.logger.Info(f"Validating session with command: {command}")
             return self.validateSessionHandler.Handle(command)
         except ValueError as ve:
             self.logger.Warning(f"Session validation failed: {ve}")
@@ -8,12 +8,13 @@ from src.Session.Application.ValidateSession import ValidateSessionCommand
 class Routes:
     @classmethod
     def RegisterRoutes(cls, router: APIRouter, controller: SessionController):
+        # Sync so FastAPI runs the blocking database calls in its threadpool
         @router.post("/sessions")
-        async def CreateSession(command: CreateSessionCommand):
+        def CreateSession(command: CreateSessionCommand):
             return controller.CreateSession(command)
 
         @router.post("/sessions/{sessionId}/validate", status_code=status.HTTP_204_NO_CONTENT)
-        async def ValidateSession(sessionId: UUID, command: ValidateSessionCommand):
+        def ValidateSession(sessionId: UUID, command: ValidateSessionCommand):
             command.sessionId = sessionId
             return controller.ValidateSession(command)
 
@@ -6,6 +6,7 @@ import os
 import re
 from enum import Enum
 from pydantic import Field, BaseModel, field_validator
+from src.Shared.Enums import LogLevelEnum
 
 
 class OSType(str, Enum):
@@ -19,10 +20,14 @@ class OSType(str, Enum):
     OTHER = "other"
 
 
+OS_TYPE_VALUES = frozenset(item.value for item in OSType)
+
+APP_NAME_PATTERN = re.compile(r"[a-zA-Z0-9_]+")
+VERSION_PATTERN = re.compile(r"\d+\.\d+\.\d+")
+
+
 class AppConfig(BaseModel):
-    operatingSystem: OSType = (
-        OSType(os.name) if os.name in {item.value for item in OSType} else OSType.OTHER
-    )
+    operatingSystem: OSType = OSType(os.name) if os.name in OS_TYPE_VALUES else OSType.OTHER
     appName: str = Field(..., description="The name of the application")
     version: str = Field(..., description="The version of the application")
     debug: bool = Field(False, description="Enable debug mode")
@@ -30,7 +35,20 @@ class AppConfig(BaseModel):
     port: int = Field(8000, description="Port number for the application server")
     host: str = Field("localhost", description="Host name for the application server")
     logTarget: str = Field(..., description="Target for logging (e.g., file, console)")
+    logLevel: LogLevelEnum = Field(
+        LogLevelEnum.INFO, description="Minimum level of logged messages"
+    )
     authCodeExpiryMinutes: int = Field(5, description="Authentication code expiry time in minutes")
+    databasePoolSize: int = Field(20, description="Persistent connections kept in the pool")
+    databaseMaxOverflow: int = Field(
+        40, description="Extra connections allowed above the pool size"
+    )
+    databasePoolRecycleSeconds: int = Field(
+        1800, description="Age in seconds after which pooled connections are replaced"
+    )
+    queryCountWarningThreshold: int = Field(
+        20, description="SQL statements per request above which a warning is logged"
+    )
 
     @classmethod
     def FromEnv(cls):
@@ -38,15 +56,25 @@ class AppConfig(BaseModel):
         if not databaseUrl:
             raise ValueError("DATABASE_URL environment variable is required")
 
+        debug: bool = os.getenv("DEBUG", "false").lower() == "true"
+        logLevel: str = os.getenv("LOG_LEVEL", "DEBUG" if debug else "INFO").upper()
+        if logLevel not in LogLevelEnum.__members__:
+            raise ValueError(f"LOG_LEVEL must be one of {list(LogLevelEnum.__members__)}")
+
         return cls(
             appName=os.getenv("APP_NAME", "Authentication"),
             version=os.getenv("VERSION", "1.0.0"),
-            debug=os.getenv("DEBUG", "false").lower() == "true",
+            debug=debug,
             databaseUrl=databaseUrl,
             port=int(os.getenv("PORT", "8000")),
             host=os.getenv("HOST", "localhost"),
             logTarget=os.getenv("LOG_TARGET", "console"),
+            logLevel=LogLevelEnum[logLevel],
             authCodeExpiryMinutes=int(os.getenv("AUTH_CODE_EXPIRY_MINUTES", "10")),
+            databasePoolSize=int(os.getenv("DATABASE_POOL_SIZE", "20")),
+            databaseMaxOverflow=int(os.getenv("DATABASE_MAX_OVERFLOW", "40")),
+            databasePoolRecycleSeconds=int(os.getenv("DATABASE_POOL_RECYCLE_SECONDS", "1800")),
+            queryCountWarningThreshold=int(os.getenv("QUERY_COUNT_WARNING_THRESHOLD", "20")),
         )
 
     @field_validator("port")
@@ -56,6 +84,20 @@ class AppConfig(BaseModel):
             raise ValueError("Port must be between 1 and 65535")
         return value
 
+    @field_validator("databasePoolSize", "databaseMaxOverflow", "databasePoolRecycleSeconds")
+    @classmethod
+    def ValidateDatabasePool(cls, value: int) -> int:
+        if value < 0:
+            raise ValueError("Database pool settings cannot be negative")
+        return value
+
+    @field_validator("queryCountWarningThreshold")
+    @classmethod
+    def ValidateQueryCountWarningThreshold(cls, value: int) -> int:
+        if value < 1:
+            raise ValueError("Query count warning threshold must be positive")
+        return value
+
     @field_validator("debug")
     @classmethod
     def ValidateDebug(cls, value: bool) -> bool:
@@ -75,7 +117,7 @@ class AppConfig(BaseModel):
     def ValidateAppName(cls, value: str) -> str:
         if not value:
             raise ValueError("Application name cannot be empty")
-        if not re.match(r"^[a-zA-Z0-9_]+$", value):
+        if not APP_NAME_PATTERN.fullmatch(value):
             raise ValueError(
                 "Application name must contain only alphanumeric characters and underscores"
             )
@@ -86,8 +128,7 @@ class AppConfig(BaseModel):
     def ValidateVersion(cls, value: str) -> str:
         if not value:
             raise ValueError("Version cannot be empty")
-        versionRegex = r"^\d+\.\d+\.\d+$"
-        if not re.match(versionRegex, value):
+        if not VERSION_PATTERN.fullmatch(value):
             raise ValueError("Version must be in the format X.Y.Z")
         return value
 
@@ -100,4 +141,5 @@ class AppConfig(BaseModel):
             "port": self.port,
             "host": self.host,
             "logTarget": self.logTarget,
+            "logLevel": self.logLevel.name,
         }
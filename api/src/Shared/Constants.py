@@ -0,0 +1,11 @@
+"""
+Database table names shared by the ORM models and repositories.
+"""
+
+USERS_TABLE = "t_users"
+ROLES_TABLE = "t_roles"
+ROLE_ASSIGNMENTS_TABLE = "t_role_assignments"
+AUTHENTICATION_CREDENTIALS_TABLE = "t_authentication_credentials"
+AUTHENTICATION_CODES_TABLE = "t_authentication_codes"
+SESSIONS_TABLE = "t_sessions"
+CLIENTS_TABLE = "t_clients"
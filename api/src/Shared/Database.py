@@ -0,0 +1,30 @@
+from typing import Any, Dict, List, Type
+from sqlalchemy.dialects.postgresql import Insert, insert
+
+
+class RowMixin:
+    """
+    Mixin for declarative bases whose models are mapped back to domain models.
+    """
+
+    def ToRow(self) -> dict:
+        """
+        Column values as returned by the driver, with native UUIDs and datetimes.
+        """
+        return {column.key: getattr(self, column.key) for column in self.__table__.columns}
+
+
+def Upsert(model: Type[RowMixin], rows: List[Dict[str, Any]]) -> Insert:
+    """
+    INSERT ... ON CONFLICT (primary key) DO UPDATE for the given rows.
+
+    Unlike Session.merge, no SELECT is issued first to find out whether the rows exist.
+    Conflicts on other unique constraints still raise IntegrityError.
+    """
+    table = model.__table__
+    primaryKey = [column.key for column in table.primary_key]
+    stmt = insert(table).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=primaryKey,
+        set_={key: stmt.excluded[key] for key in rows[0] if key not in primaryKey},
+    )
@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class AuthenticationMethodEnum(str, Enum):
@@ -8,3 +8,10 @@ class AuthenticationMethodEnum(str, Enum):
     FACEBOOK = "social:facebook"
     GITHUB = "social:github"
     TWITTER = "social:twitter"
+
+
+class LogLevelEnum(IntEnum):
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    ERROR = 40
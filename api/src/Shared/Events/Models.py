@@ -5,67 +5,18 @@ from pydantic import BaseModel, Field
 class BaseEvent(BaseModel):
     """
     Base class for all events in the system.
-    This class provides a foundation for creating event objects with a unique name
-    identifier. Events can be compared for equality and used as dictionary keys
-    or in sets due to the implemented hash functionality.
+    Subscribers are registered against event classes, so an event is routed by its type
+    rather than by its name.
     Attributes:
         name (str): The unique name identifier for the event.
-    Methods:
-        __eq__(other): Compares two BaseEvent instances for equality based on their names.
-        __hash__(): Returns a hash value based on the event name for use in collections.
     Example:
-        >>> event1 = BaseEvent("user_login")
-        >>> event2 = BaseEvent("user_login")
-        >>> event1 == event2
-        True
-        >>> {event1, event2}  # Can be used in sets
-        {BaseEvent('user_login')}
+        >>> class UserLoggedIn(BaseEvent):
+        ...     userId: str
+        >>> event = UserLoggedIn(name="user_login", userId="123")
     """
 
     name: str = Field(..., min_length=1, max_length=100)
 
-    def __eq__(self, other: object) -> bool:
-        """
-        Compare two BaseEvent instances for equality.
-
-        Two BaseEvent instances are considered equal if they have the same name.
-        If the other object is not a BaseEvent instance, returns False.
-
-        Args:
-            other (object): The object to compare with this BaseEvent instance.
-
-        Returns:
-            bool: True if both objects are BaseEvent instances with the same name,
-                  False otherwise.
-
-        Examples:
-            >>> event1 = BaseEvent("test_event")
-            >>> event2 = BaseEvent("test_event")
-            >>> event3 = BaseEvent("other_event")
-            >>> event1 == event2
-            True
-            >>> event1 == event3
-            False
-            >>> event1 == "test_event"
-            False
-        """
-        if isinstance(other, BaseEvent):
-            return self.name == other.name
-        return False
-
-    def __hash__(self) -> int:
-        """
-        Return hash value for the event based on its name.
-
-        This method enables the event to be used as a key in dictionaries
-        and as an element in sets by providing a hash value derived from
-        the event's name attribute.
-
-        Returns:
-            int: Hash value of the event's name.
-        """
-        return hash(self.name)
-
 
 EventSubscriber = Callable[[BaseEvent], None]
 EventClass = Any
@@ -81,7 +32,7 @@ class EventDispatcher:
 
     Attributes:
         subscribers (Dict[EventClass, List[EventSubscriber]]):
-            Dictionary mapping events to their subscribers.
+            Dictionary mapping event classes to their subscribers.
     """
 
     def __init__(self):
@@ -154,8 +105,9 @@ class EventDispatcher:
             >>> event = UserCreatedEvent(user_id=123, email="user@example.com")
             >>> dispatcher.dispatch(event)
         """
-        if event in self.subscribers:
-            for subscriber in self.subscribers[event]:
+        subscribers = self.subscribers.get(type(event))
+        if subscribers:
+            for subscriber in subscribers:
                 subscriber(event)
 
 
@@ -171,7 +123,7 @@ class EventEmitter(BaseModel):
         events (List[BaseEvent]): List of events that have been emitted.
     """
 
-    events: List[BaseEvent] = []
+    events: List[BaseEvent] = Field(default_factory=list)
 
     def EmitEvent(self, event: BaseEvent):
         """
@@ -189,9 +141,6 @@ class EventEmitter(BaseModel):
             >>> emitter.emit_event(ImageUploadedEvent(image_id=123, user_id=456))
             >>> emitter.emit_event(ThumbnailGeneratedEvent(image_id=123))
         """
-        # If self.events is not initialized, initialize it first
-        if not hasattr(self, "events"):
-            self.events = []
         self.events.append(event)
 
     def ReleaseEvents(self) -> List[BaseEvent]:
@@ -208,10 +157,5 @@ class EventEmitter(BaseModel):
         Note:
             After calling this method, the internal events list will be empty.
         """
-        # If self.events is not initialized, initialize it first
-        if not hasattr(self, "events"):
-            self.events = []
-
-        events: List[BaseEvent] = self.events
-        self.events = []
+        events, self.events = self.events, []
         return events
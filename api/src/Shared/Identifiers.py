@@ -0,0 +1,35 @@
+import os
+import time
+from typing import Union
+from uuid import UUID
+
+
+def Uuid7() -> UUID:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+    The first 48 bits hold the unix timestamp in milliseconds and the remaining bits are
+    random, so identifiers created later sort after earlier ones. Used as primary keys this
+    keeps inserts on the right edge of the B-tree index instead of scattering them.
+    :return: A new version 7 UUID.
+    """
+    timestampMs = time.time_ns() // 1_000_000
+    value = (timestampMs & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    # Version (0111) in bits 76-79 and RFC 4122 variant (10) in bits 62-63
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return UUID(int=value)
+
+
+def AsUuid(value: Union[UUID, bytes, str]) -> UUID:
+    """
+    Return the value as a UUID, parsing it only when it is not one already.
+    Database drivers hand back native UUIDs, so rows loaded through the ORM skip parsing;
+    raw 16 byte values are read directly instead of going through the hex string form.
+    :param value: A UUID, its 16 raw bytes or its string form.
+    :return: The value as a UUID.
+    """
+    if isinstance(value, UUID):
+        return value
+    if isinstance(value, (bytes, bytearray)):
+        return UUID(bytes=bytes(value))
+    return UUID(value)
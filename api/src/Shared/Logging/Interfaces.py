@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from src.Shared.Enums import LogLevelEnum
 
 
 class ILogger(ABC):
@@ -17,3 +18,7 @@ class ILogger(ABC):
     @abstractmethod
     def Debug(self, message: str):
         pass
+
+    @abstractmethod
+    def IsEnabled(self, level: LogLevelEnum) -> bool:
+        pass
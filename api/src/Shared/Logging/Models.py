@@ -1,8 +1,12 @@
 import os
-import inspect
+import sys
+import threading
+import time
 from datetime import datetime
 from random import randbytes
+from typing import Optional, TextIO
 import zipfile
+from src.Shared.Enums import LogLevelEnum
 from src.Shared.Logging.Interfaces import ILogger
 
 
@@ -11,13 +15,23 @@ class Logger(ILogger):
     This class provides logging functionality for the application.
     """
 
-    def __init__(self, target: str = "console"):
+    maxLogSize = 1024 * 1024 * 5  # 5 MB
+
+    def __init__(self, target: str = "console", level: LogLevelEnum = LogLevelEnum.DEBUG):
         """
         Initialize the logger with a target.
         :param target: The target for logging, e.g., 'console', 'file'.
+        :param level: The minimum level of the messages that are logged.
         """
         self.target = target
+        self.level = level
         self.latestCallerSent = None
+        # Formatted timestamp of the last second a message was logged in, as (second, text)
+        self.cachedTime: tuple[int, str] = (-1, "")
+        # Log file kept open between messages, with the size it has reached
+        self.file: Optional[TextIO] = None
+        self.fileSize = 0
+        self.fileLock = threading.Lock()
         if self.target != "console":
             os.makedirs(os.path.dirname(self.target), exist_ok=True)
             # Concat general.log to the target file if it is a file path
@@ -34,19 +48,41 @@ class Logger(ILogger):
         if self.target == "console":
             print(message)
         else:
-            self._LogRotate()
-            if not os.path.exists(self.target):
-                os.makedirs(os.path.dirname(self.target), exist_ok=True)
-            with open(self.target, "a", encoding="utf-8") as file:
-                file.write(message + "\n")
+            line = message + "\n"
+            with self.fileLock:
+                # The size is tracked as lines are written, so the file is only
+                # stat'ed again once it may have outgrown the limit
+                if self.file is not None and self.fileSize > self.maxLogSize:
+                    self._LogRotate()
+                    if self.file is not None:
+                        # Not rotated, e.g. the file was truncated elsewhere
+                        self.fileSize = self.file.tell()
+                if self.file is None:
+                    self._OpenLogFile()
+                self.file.write(line)
+                self.fileSize += len(line.encode("utf-8"))
+
+    def _OpenLogFile(self):
+        """
+        Open the log file for appending, line buffered so every message reaches the file
+        as soon as it is logged, without reopening it for each one.
+        """
+        os.makedirs(os.path.dirname(self.target), exist_ok=True)
+        self.file = open(  # pylint: disable=consider-using-with
+            self.target, "a", encoding="utf-8", buffering=1
+        )
+        self.fileSize = os.path.getsize(self.target)
 
     def _LogRotate(self):
         """
         Rotate the log file if it exceeds a certain size.
         """
-        maxLogSize = 1024 * 1024 * 5  # 5 MB
         if self.target != "console" and os.path.exists(self.target):
-            if os.path.getsize(self.target) > maxLogSize:
+            if os.path.getsize(self.target) > self.maxLogSize:
+                # Close the open log file; the next message opens the new one
+                if self.file is not None:
+                    self.file.close()
+                    self.file = None
                 # Rotate the log file by renaming it and creating a new one
                 monthName: str = datetime.now().strftime("%B")
                 randomBytes = randbytes(8).hex()
@@ -65,7 +101,11 @@ class Logger(ILogger):
         :param message: The original log message.
         :return: The modified log message with the current time.
         """
-        currentTime = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        second = int(time.time())
+        cachedSecond, currentTime = self.cachedTime
+        if cachedSecond != second:
+            currentTime = datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+            self.cachedTime = (second, currentTime)
         return f"[{currentTime}] {message}"
 
     def _PrependCallerInfo(self, message: str) -> str:
@@ -77,32 +117,19 @@ class Logger(ILogger):
         :param message: The original log message.
         :return: The modified log message with caller information.
         """
-        # Get the current frame and the caller frame (
-        # skip the _PrependCallerInfo method, the _Log method and the specific level method
-        # )
-        currentFrame = inspect.currentframe()
-        if currentFrame is not None:
-            # Skip the current frame
-            callerFrame = currentFrame.f_back
-            if callerFrame is not None:
-                # Skip the _log method
-                callerFrame = callerFrame.f_back
-            if callerFrame is not None:
-                # Get the caller function name and file information
-                callerFrame = callerFrame.f_back
+        # Fetch the caller's frame directly, skipping this method, the _Log method and the
+        # specific level method, instead of walking up from inspect.currentframe()
+        try:
+            callerFrame = sys._getframe(3)  # pylint: disable=protected-access
+        except ValueError:
+            return message
 
-            # If we have a valid caller frame,
-            # prepend the caller information if it is the first time
-            # we are logging from this caller in the sequence of logs
-            if callerFrame is not None:
-                callerInfo = f"{callerFrame.f_code.co_name}() in {callerFrame.f_code.co_filename}"
-                # Check if the caller info is already sent
-                if self.latestCallerSent != callerInfo:
-                    # Update the latest caller info
-                    self.latestCallerSent = callerInfo
-                    # To avoid excessive logging,
-                    # we only prepend caller info once per subsequent log
-                    return f"{callerInfo}\n{message}"
+        callerInfo = f"{callerFrame.f_code.co_name}() in {callerFrame.f_code.co_filename}"
+        # Prepend the caller information only if it is the first time
+        # we are logging from this caller in the sequence of logs
+        if self.latestCallerSent != callerInfo:
+            self.latestCallerSent = callerInfo
+            return f"{callerInfo}\n{message}"
         return message
 
     def Info(self, message: str):
@@ -110,25 +137,38 @@ class Logger(ILogger):
         Log an informational message.
         :param message: The message to log.
         """
-        self._Log(f"[INFO] - {message}")
+        if self.IsEnabled(LogLevelEnum.INFO):
+            self._Log(f"[INFO] - {message}")
 
     def Warning(self, message: str):
         """
         Log a warning message.
         :param message: The message to log.
         """
-        self._Log(f"[WARNING] - {message}")
+        if self.IsEnabled(LogLevelEnum.WARNING):
+            self._Log(f"[WARNING] - {message}")
 
     def Error(self, message: str):
         """
         Log an error message.
         :param message: The message to log.
         """
-        self._Log(f"[ERROR] - {message}")
+        if self.IsEnabled(LogLevelEnum.ERROR):
+            self._Log(f"[ERROR] - {message}")
 
     def Debug(self, message: str):
         """
         Log a debug message.
         :param message: The message to log.
         """
-        self._Log(f"[DEBUG] - {message}")
+        if self.IsEnabled(LogLevelEnum.DEBUG):
+            self._Log(f"[DEBUG] - {message}")
+
+    def IsEnabled(self, level: LogLevelEnum) -> bool:
+        """
+        Check whether messages of a given level are logged.
+        Callers use this to skip formatting messages that would be dropped.
+        :param level: The level to check.
+        :return: True if messages of the level are logged, False otherwise.
+        """
+        return level >= self.level
@@ -1,7 +1,24 @@
 from datetime import datetime, timezone
-from pydantic import BaseModel, Field
+from functools import partial
+from typing import Annotated, Any, Union
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
 from src.Shared.Enums import AuthenticationMethodEnum
 
+# Current UTC time, bound once instead of passing the timezone on every call
+UtcNow = partial(datetime.now, timezone.utc)
+
+
+def AsDatetime(value: Union[datetime, str]) -> datetime:
+    """
+    Return the value as a datetime, parsing it only when it is an ISO 8601 string.
+    A trailing "Z", as written by pydantic's JSON mode, is accepted on Python 3.10 too.
+    """
+    if isinstance(value, datetime):
+        return value
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
 
 class HistoryClass(BaseModel):
     """
@@ -12,31 +29,18 @@ class HistoryClass(BaseModel):
             Defaults to the current UTC time.
         updatedAt (datetime):
             The timestamp indicating when the instance was last updated.
-            Defaults to the current UTC time.
-    Methods:
-        UpdateTimestamp(func):
-            A static method decorator that updates the `updatedAt` timestamp
-            whenever the decorated method is called.
+            Defaults to the creation timestamp.
+    Mutating methods of subclasses set `updatedAt` to `UtcNow()` themselves.
     """
 
-    createdAt: datetime = datetime.now(timezone.utc)
-    updatedAt: datetime = datetime.now(timezone.utc)
-
-    @staticmethod
-    def UpdateTimestamp(func):
-        """
-        Decorator to update the updatedAt timestamp on method calls.
-        """
-
-        def Wrapper(self, *args, **kwargs):
-            result = func(self, *args, **kwargs)
-            self.updatedAt = datetime.now(timezone.utc)
-            return result
-
-        return Wrapper
+    createdAt: datetime = Field(default_factory=UtcNow)
+    updatedAt: datetime = Field(default_factory=lambda data: data["createdAt"])
 
 
 class AuthenticationMethod(BaseModel):
+    # Immutable, so the instances in AUTHENTICATION_METHODS can be shared
+    model_config = ConfigDict(frozen=True)
+
     value: AuthenticationMethodEnum = Field(...)
     _levelMap = {
         AuthenticationMethodEnum.PASSWORD: 1,
@@ -55,3 +59,24 @@ class AuthenticationMethod(BaseModel):
             return self._levelMap[self.value] == self._levelMap[other.value]
         except (ValueError, KeyError, AttributeError):
             return False
+
+
+# One shared instance per method, instead of building and validating a model on every use
+AUTHENTICATION_METHODS = {
+    method: AuthenticationMethod(value=method) for method in AuthenticationMethodEnum
+}
+
+
+def AsAuthenticationMethod(value: Any) -> Any:
+    """
+    Return the shared AuthenticationMethod for a method name, leaving anything else
+    to the model's own validation.
+    """
+    if isinstance(value, str):
+        return AUTHENTICATION_METHODS[AuthenticationMethodEnum(value)]
+    return value
+
+
+# AuthenticationMethod field that also accepts the method's name, coerced by pydantic-core
+# before validation instead of through a validator declared on every command class
+AuthenticationMethodField = Annotated[AuthenticationMethod, BeforeValidator(AsAuthenticationMethod)]
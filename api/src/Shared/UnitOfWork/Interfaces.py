@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+
+class IUnitOfWork(ABC):
+    @abstractmethod
+    def __enter__(self) -> "IUnitOfWork":
+        pass
+
+    @abstractmethod
+    def __exit__(self, excType, excValue, traceback) -> bool:
+        pass
@@ -0,0 +1,49 @@
+from sqlalchemy.orm import Session as DatabaseSession
+from src.Shared.UnitOfWork.Interfaces import IUnitOfWork
+
+
+class SqlUnitOfWork(IUnitOfWork):
+    """
+    This class groups the repository writes of a handler into one database transaction.
+    Repositories only flush their changes; the outermost unit of work commits them
+    when its block exits cleanly, or rolls them back when it raises.
+    Units of work sharing a database session can be nested, e.g. a handler calling
+    another context's handler, and only the outermost one ends the transaction.
+    """
+
+    depthKey = "unitOfWorkDepth"
+
+    def __init__(self, session: DatabaseSession):
+        """
+        Initialize the unit of work with a database session.
+        :param session: The database session shared with the repositories.
+        """
+        self.session = session
+
+    def __enter__(self) -> "SqlUnitOfWork":
+        """
+        Enter the unit of work, increasing the nesting depth of the session.
+        :return: The unit of work itself.
+        """
+        self.session.info[self.depthKey] = self.session.info.get(self.depthKey, 0) + 1
+        return self
+
+    def __exit__(self, excType, excValue, traceback) -> bool:
+        """
+        Leave the unit of work, ending the transaction if it is the outermost one.
+        :return: False, so exceptions raised inside the block are propagated.
+        """
+        depth = self.session.info[self.depthKey] - 1
+        self.session.info[self.depthKey] = depth
+        if depth > 0:
+            return False
+
+        if excType is None:
+            try:
+                self.session.commit()
+            except Exception:
+                self.session.rollback()
+                raise
+        else:
+            self.session.rollback()
+        return False
@@ -5,9 +5,14 @@ Unit tests for ListAllUsers Command and Handler classes.
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from pydantic import ValidationError
+from datetime import datetime, timezone
+from uuid import UUID
 from src.Authentication.Application.ListAllUsers import (
     ListAllUsersCommand as Command,
     ListAllUsersHandler as Handler,
+    EncodeCursor,
+    DecodeCursor,
+    NextCursor,
 )
 from src.Authentication.Domain.Models import User
 from src.Authentication.Domain.Interfaces import IUserRepository
@@ -74,14 +79,14 @@ class TestCommand:
         with pytest.raises(ValidationError) as exc_info:
             Command(sortBy="invalid_field")
 
-        assert "sortBy must be one of" in str(exc_info.value)
+        assert exc_info.value.errors()[0]["type"] == "literal_error"
 
     def test_invalid_sort_order(self):
         """Test Command validation with invalid sortOrder."""
         with pytest.raises(ValidationError) as exc_info:
             Command(sortOrder="invalid_order")
 
-        assert "sortOrder must be one of" in str(exc_info.value)
+        assert exc_info.value.errors()[0]["type"] == "literal_error"
 
     def test_limit_below_minimum(self):
         """Test Command validation with limit below minimum."""
@@ -114,30 +119,6 @@ class TestCommand:
         with pytest.raises(ValidationError):
             Command(sortOrder="DESC")  # Should be "desc"
 
-    def test_validate_sort_by_classmethod(self):
-        """Test ValidateSortBy class method directly."""
-        # Valid values should pass
-        for valid_value in ["id", "email", "username", "createdAt", "updatedAt"]:
-            result = Command.ValidateSortBy(valid_value)
-            assert result == valid_value
-
-        # Invalid values should raise ValueError
-        with pytest.raises(ValueError) as exc_info:
-            Command.ValidateSortBy("invalid")
-        assert "sortBy must be one of" in str(exc_info.value)
-
-    def test_validate_sort_order_classmethod(self):
-        """Test ValidateSortOrder class method directly."""
-        # Valid values should pass
-        for valid_value in ["asc", "desc"]:
-            result = Command.ValidateSortOrder(valid_value)
-            assert result == valid_value
-
-        # Invalid values should raise ValueError
-        with pytest.raises(ValueError) as exc_info:
-            Command.ValidateSortOrder("invalid")
-        assert "sortOrder must be one of" in str(exc_info.value)
-
     def test_field_constraints_types(self):
         """Test that fields have correct types."""
         command = Command()
@@ -153,7 +134,13 @@ class TestCommand:
 
         # Test model_dump
         data = command.model_dump()
-        expected = {"sortBy": "email", "sortOrder": "desc", "limit": 25, "offset": 50}
+        expected = {
+            "sortBy": "email",
+            "sortOrder": "desc",
+            "limit": 25,
+            "offset": 50,
+            "cursor": None,
+        }
         assert data == expected
 
     def test_pydantic_deserialization(self):
@@ -166,6 +153,44 @@ class TestCommand:
         assert command.limit == 15
         assert command.offset == 5
 
+    def test_invalid_cursor(self):
+        """Test Command validation with a cursor that cannot be decoded."""
+        with pytest.raises(ValidationError):
+            Command(cursor="not-a-cursor")
+
+
+class TestCursor:
+    """Test cases for the keyset pagination cursor helpers."""
+
+    USER_ID = "323e4567-e89b-12d3-a456-426614174000"
+
+    def test_round_trip_typed_by_sort_field(self):
+        """Test that decoded sort values are typed for comparison in the database."""
+        cursor = EncodeCursor("2024-01-01T00:00:00Z", self.USER_ID)
+
+        sortValue, id = DecodeCursor(cursor, "createdAt")
+
+        assert sortValue == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert id == UUID(self.USER_ID)
+        assert DecodeCursor(EncodeCursor(self.USER_ID, self.USER_ID), "id")[0] == id
+        assert DecodeCursor(EncodeCursor("a@b.co", self.USER_ID), "email")[0] == "a@b.co"
+
+    def test_next_cursor_points_after_last_user(self):
+        """Test that a full page yields a cursor built from its last user."""
+        users = [
+            {"id": self.USER_ID, "email": "a@b.co", "authenticationCredentials": {"username": "a"}}
+        ]
+
+        emailCursor = NextCursor(Command(sortBy="email", limit=1), users)
+        usernameCursor = NextCursor(Command(sortBy="username", limit=1), users)
+
+        assert DecodeCursor(emailCursor, "email") == ("a@b.co", UUID(self.USER_ID))
+        assert DecodeCursor(usernameCursor, "username") == ("a", UUID(self.USER_ID))
+
+    def test_no_next_cursor_on_last_page(self):
+        """Test that a partial page yields no cursor."""
+        assert NextCursor(Command(limit=10), []) is None
+
 
 class TestHandler:
     """Test cases for ListAllUsers Handler class."""
@@ -228,7 +253,7 @@ class TestHandler:
 
             # Verify repository was called with correct parameters
             mock_user_repository.ListAll.assert_called_once_with(
-                sortBy="id", sortOrder="asc", limit=10, offset=0
+                sortBy="id", sortOrder="asc", limit=10, offset=0, after=None
             )
 
             # Verify logging calls
@@ -260,7 +285,7 @@ class TestHandler:
 
             # Verify repository was called with correct parameters
             mock_user_repository.ListAll.assert_called_once_with(
-                sortBy="email", sortOrder="desc", limit=50, offset=20
+                sortBy="email", sortOrder="desc", limit=50, offset=20, after=None
             )
 
             # Verify logging calls
@@ -332,7 +357,7 @@ class TestHandler:
 
                 # Verify repository was called with correct sortBy
                 mock_user_repository.ListAll.assert_called_once_with(
-                    sortBy=sort_field, sortOrder="asc", limit=10, offset=0
+                    sortBy=sort_field, sortOrder="asc", limit=10, offset=0, after=None
                 )
 
     def test_handle_with_both_sort_orders(
@@ -353,7 +378,7 @@ class TestHandler:
 
                 # Verify repository was called with correct sortOrder
                 mock_user_repository.ListAll.assert_called_once_with(
-                    sortBy="id", sortOrder=sort_order, limit=10, offset=0
+                    sortBy="id", sortOrder=sort_order, limit=10, offset=0, after=None
                 )
 
     def test_handle_with_boundary_limit_values(
@@ -374,7 +399,7 @@ class TestHandler:
 
                 # Verify repository was called with correct limit
                 mock_user_repository.ListAll.assert_called_once_with(
-                    sortBy="id", sortOrder="asc", limit=limit_value, offset=0
+                    sortBy="id", sortOrder="asc", limit=limit_value, offset=0, after=None
                 )
 
     def test_handle_with_large_offset(
@@ -391,7 +416,7 @@ class TestHandler:
 
             # Verify repository was called with correct offset
             mock_user_repository.ListAll.assert_called_once_with(
-                sortBy="id", sortOrder="asc", limit=10, offset=1000
+                sortBy="id", sortOrder="asc", limit=10, offset=1000, after=None
             )
 
     def test_handle_logging_message_format(
@@ -466,6 +491,19 @@ class TestHandler:
             asc order, limit 10, offset 0"""
         )
 
+    def test_handle_with_cursor(self, handler, mock_user_repository, sample_users):
+        """Test that the cursor is decoded and passed to the repository as a sort key."""
+        userId = "323e4567-e89b-12d3-a456-426614174000"
+        command = Command(sortBy="email", cursor=EncodeCursor("a@b.co", userId))
+        mock_user_repository.ListAll.return_value = sample_users
+
+        with patch.object(User, "ToDicts"):
+            handler.Handle(command)
+
+        mock_user_repository.ListAll.assert_called_once_with(
+            sortBy="email", sortOrder="asc", limit=10, offset=0, after=("a@b.co", UUID(userId))
+        )
+
     def test_handler_dependency_injection(self):
         """Test that Handler properly uses dependency injection."""
         # Create specific mock instances
@@ -15,6 +15,7 @@ from src.Authentication.Domain.Interfaces import IHashingService, IUserRepositor
 from src.Authentication.Domain.Sevices import UniquenessService
 from src.Shared.Events.Models import EventDispatcher, BaseEvent
 from src.Shared.Logging.Interfaces import ILogger
+from src.Shared.UnitOfWork.Interfaces import IUnitOfWork
 
 
 class TestCommand:
@@ -119,6 +120,14 @@ class TestCommand:
         with pytest.raises(ValidationError):
             Command(email="test@example.com", username="testuser", password="")
 
+    def test_str_and_repr_hide_password(self):
+        """Test Command string representations never include the password."""
+        command = Command(email="test@example.com", username="testuser", password="password123")
+
+        for text in (str(command), repr(command), f"{command}"):
+            assert "password123" not in text
+            assert "testuser" in text
+
     def test_special_characters_in_username(self):
         """Test Command with special characters in username."""
         command = Command(email="test@example.com", username="user_123", password="password123")
@@ -192,6 +201,13 @@ class TestHandler:
         """Create a mock logger."""
         return Mock(spec=ILogger)
 
+    @pytest.fixture
+    def mock_unit_of_work(self):
+        """Create a mock unit of work that propagates exceptions."""
+        unitOfWork = MagicMock(spec=IUnitOfWork)
+        unitOfWork.__exit__.return_value = False
+        return unitOfWork
+
     @pytest.fixture
     def handler(
         self,
@@ -200,6 +216,7 @@ class TestHandler:
         mock_uniqueness_service,
         mock_event_dispatcher,
         mock_logger,
+        mock_unit_of_work,
     ):
         """Create a Handler instance with mocked dependencies."""
         return Handler(
@@ -208,6 +225,7 @@ class TestHandler:
             uniquenessService=mock_uniqueness_service,
             eventDispatcher=mock_event_dispatcher,
             logger=mock_logger,
+            unitOfWork=mock_unit_of_work,
         )
 
     @pytest.fixture
@@ -227,6 +245,7 @@ class TestHandler:
         mock_uniqueness_service,
         mock_event_dispatcher,
         mock_logger,
+        mock_unit_of_work,
     ):
         """Test Handler initialization."""
         handler = Handler(
@@ -235,6 +254,7 @@ class TestHandler:
             uniquenessService=mock_uniqueness_service,
             eventDispatcher=mock_event_dispatcher,
             logger=mock_logger,
+            unitOfWork=mock_unit_of_work,
         )
 
         assert handler.userRepository is mock_user_repository
@@ -242,6 +262,7 @@ class TestHandler:
         assert handler.uniquenessService is mock_uniqueness_service
         assert handler.eventDispatcher is mock_event_dispatcher
         assert handler.logger is mock_logger
+        assert handler.unitOfWork is mock_unit_of_work
 
     def test_handle_successful_registration(
         self,
@@ -264,10 +285,9 @@ class TestHandler:
             result = handler.Handle(valid_command)
 
             # Verify uniqueness validation
-            mock_uniqueness_service.ValidateIsEmailUnique.assert_called_once_with(
-                "test@example.com"
+            mock_uniqueness_service.ValidateUnique.assert_called_once_with(
+                "test@example.com", "testuser"
             )
-            mock_uniqueness_service.ValidateIsUsernameUnique.assert_called_once_with("testuser")
 
             # Verify password hashing
             mock_hashing_service.Hash.assert_called_once_with("password123")
@@ -290,32 +310,28 @@ class TestHandler:
     def test_handle_email_not_unique(self, handler, valid_command, mock_uniqueness_service):
         """Test handling when email is not unique."""
         # Make email validation fail
-        mock_uniqueness_service.ValidateIsEmailUnique.side_effect = ValueError(
-            "Email already in use"
-        )
+        mock_uniqueness_service.ValidateUnique.side_effect = ValueError("Email already in use")
 
         with pytest.raises(ValueError, match="Email already in use"):
             handler.Handle(valid_command)
 
-        # Verify email validation was called
-        mock_uniqueness_service.ValidateIsEmailUnique.assert_called_once_with("test@example.com")
-
-        # Verify username validation was not called (short-circuited)
-        mock_uniqueness_service.ValidateIsUsernameUnique.assert_not_called()
+        # Verify email and username were validated together
+        mock_uniqueness_service.ValidateUnique.assert_called_once_with(
+            "test@example.com", "testuser"
+        )
 
     def test_handle_username_not_unique(self, handler, valid_command, mock_uniqueness_service):
         """Test handling when username is not unique."""
         # Make username validation fail
-        mock_uniqueness_service.ValidateIsUsernameUnique.side_effect = ValueError(
-            "Username already in use"
-        )
+        mock_uniqueness_service.ValidateUnique.side_effect = ValueError("Username already in use")
 
         with pytest.raises(ValueError, match="Username already in use"):
             handler.Handle(valid_command)
 
-        # Verify both validations were called
-        mock_uniqueness_service.ValidateIsEmailUnique.assert_called_once_with("test@example.com")
-        mock_uniqueness_service.ValidateIsUsernameUnique.assert_called_once_with("testuser")
+        # Verify email and username were validated together
+        mock_uniqueness_service.ValidateUnique.assert_called_once_with(
+            "test@example.com", "testuser"
+        )
 
     def test_handle_with_different_command_data(
         self, handler, mock_uniqueness_service, mock_hashing_service, sample_user_id
@@ -334,11 +350,8 @@ class TestHandler:
             result = handler.Handle(command)
 
             # Verify validation with different data
-            mock_uniqueness_service.ValidateIsEmailUnique.assert_called_once_with(
-                "different@example.com"
-            )
-            mock_uniqueness_service.ValidateIsUsernameUnique.assert_called_once_with(
-                "differentuser"
+            mock_uniqueness_service.ValidateUnique.assert_called_once_with(
+                "different@example.com", "differentuser"
             )
 
             # Verify password hashing with different password
@@ -438,11 +451,8 @@ class TestHandler:
         # Create a mock that tracks call order
         call_order = []
 
-        def track_email_validation(email):
-            call_order.append("email_validation")
-
-        def track_username_validation(username):
-            call_order.append("username_validation")
+        def track_uniqueness_validation(email, username):
+            call_order.append("uniqueness_validation")
 
         def track_password_hashing(password):
             call_order.append("password_hashing")
@@ -462,8 +472,7 @@ class TestHandler:
             call_order.append("event_dispatch")
 
         # Setup mocks with tracking
-        handler.uniquenessService.ValidateIsEmailUnique.side_effect = track_email_validation
-        handler.uniquenessService.ValidateIsUsernameUnique.side_effect = track_username_validation
+        handler.uniquenessService.ValidateUnique.side_effect = track_uniqueness_validation
         handler.hashingService.Hash.side_effect = track_password_hashing
         handler.userRepository.Save.side_effect = track_user_save
         handler.eventDispatcher.DispatchAll.side_effect = track_event_dispatch
@@ -473,8 +482,7 @@ class TestHandler:
 
         # Verify execution order
         expected_order = [
-            "email_validation",
-            "username_validation",
+            "uniqueness_validation",
             "password_hashing",
             "user_creation",
             "user_save",
@@ -515,6 +523,7 @@ class TestHandler:
         uniqueness_mock = Mock(spec=UniquenessService)
         dispatcher_mock = Mock(spec=EventDispatcher)
         logger_mock = Mock(spec=ILogger)
+        unit_of_work_mock = MagicMock(spec=IUnitOfWork)
 
         # Create handler with these dependencies
         handler = Handler(
@@ -523,6 +532,7 @@ class TestHandler:
             uniquenessService=uniqueness_mock,
             eventDispatcher=dispatcher_mock,
             logger=logger_mock,
+            unitOfWork=unit_of_work_mock,
         )
 
         # Verify dependencies are stored correctly
@@ -531,6 +541,7 @@ class TestHandler:
         assert handler.uniquenessService is uniqueness_mock
         assert handler.eventDispatcher is dispatcher_mock
         assert handler.logger is logger_mock
+        assert handler.unitOfWork is unit_of_work_mock
 
     def test_command_immutability_during_handling(self, handler, valid_command):
         """Test that command data is not modified during handling."""
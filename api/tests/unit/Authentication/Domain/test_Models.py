@@ -1,6 +1,6 @@
 import pytest
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timezone
 from src.Authentication.Domain.Models import AuthenticationCredentials, Role, RoleAssignment, User
 
 
@@ -215,6 +215,11 @@ class TestRoleAssignment:
         assignment_dict = assignment.ToDict()
         assert assignment_dict == valid_database_role_assignment_data
 
+    def test_role_assignment_is_slotted(self, valid_role_assignment_data):
+        assignment = RoleAssignment.Create(**valid_role_assignment_data)
+        assert not hasattr(assignment, "__dict__")
+        assert assignment.updatedAt == assignment.createdAt
+
 
 class TestUser:
     @pytest.fixture
@@ -301,6 +306,40 @@ class TestUser:
         assert isinstance(user.authenticationCredentials.id, UUID)
         assert len(user.roleAssignments) == 0
 
+    def test_create_user_timestamps(self, valid_user_data):
+        before = datetime.now(timezone.utc)
+        user = User.Create(**valid_user_data)
+        assert user.createdAt >= before
+        assert user.createdAt <= datetime.now(timezone.utc)
+        assert user.updatedAt == user.createdAt
+
+    def test_create_from_database_batch(self, valid_database_user_data):
+        row = {
+            key: value
+            for key, value in valid_database_user_data.items()
+            if key not in ("authenticationCredentials", "roleAssignments")
+        }
+        other_row = {**row, "id": "423e4567-e89b-12d3-a456-426614174999"}
+        users = User.FromDatabaseBatch(
+            [row, other_row],
+            {
+                row["id"]: valid_database_user_data["authenticationCredentials"],
+                other_row["id"]: valid_database_user_data["authenticationCredentials"],
+            },
+            {row["id"]: valid_database_user_data["roleAssignments"]},
+        )
+        assert [str(user.id) for user in users] == [row["id"], other_row["id"]]
+        assert len(users[0].roleAssignments) == len(valid_database_user_data["roleAssignments"])
+        assert users[1].roleAssignments == []
+        assert users[1].authenticationCredentials.username == "dbuser"
+
+    def test_mutation_updates_timestamp(self, valid_database_user_data):
+        user = User.FromDatabase(valid_database_user_data)
+        before = datetime.now(timezone.utc)
+        user.ChangeEmail("changed@example.com")
+        assert user.updatedAt >= before
+        assert user.createdAt == datetime.fromisoformat(valid_database_user_data["createdAt"])
+
     def test_create_from_database(self, valid_database_user_data):
         user = User.FromDatabase(valid_database_user_data)
         assert user.id == UUID(valid_database_user_data["id"])
@@ -389,6 +428,14 @@ class TestUser:
         assert len(user.roleAssignments) == len(valid_role_assignments_data) - 1
         assert all(ra.id != role_assignment_to_remove.id for ra in user.roleAssignments)
 
+    def test_remove_role_assignment_loaded_from_database(self, valid_database_user_data):
+        user = User.FromDatabase(valid_database_user_data)
+        role_assignment_to_remove = user.roleAssignments[0]
+        user.RemoveRoleAssignment(role_assignment_to_remove.id)
+        assert all(ra.id != role_assignment_to_remove.id for ra in user.roleAssignments)
+        user.AddRoleAssignment(role_assignment_to_remove)
+        assert user.roleAssignments[-1].id == role_assignment_to_remove.id
+
     def test_remove_nonexistent_role_assignment(self, valid_user_data):
         user = User.Create(**valid_user_data)
         non_existent_id = UUID("323e4567-e89b-12d3-a456-426614174999")
@@ -425,3 +472,10 @@ class TestUser:
         user = User.Create(**valid_user_data)
         user.ClearRoleAssignments()
         assert len(user.roleAssignments) == 0
+
+    def test_add_role_assignment_after_clear(self, valid_database_user_data):
+        user = User.FromDatabase(valid_database_user_data)
+        existing_role_assignment = user.roleAssignments[0]
+        user.ClearRoleAssignments()
+        user.AddRoleAssignment(existing_role_assignment)
+        assert len(user.roleAssignments) == 1
@@ -0,0 +1,64 @@
+"""
+Unit tests for the SQL repositories of the Authentication context.
+"""
+
+import pytest
+from unittest.mock import Mock
+from uuid import uuid4
+from sqlalchemy.orm import Session as DatabaseSession
+from src.Authentication.Domain.Models import RoleAssignment, User
+from src.Authentication.Infrastructure.Database.SqlRepositories import (
+    DELETE_REMOVED_ROLE_ASSIGNMENTS,
+    SqlUserRepository,
+)
+
+
+class TestSqlUserRepository:
+    """Test cases for SqlUserRepository class."""
+
+    @pytest.fixture
+    def mock_session(self):
+        """Create a mock database session."""
+        return Mock(spec=DatabaseSession)
+
+    @pytest.fixture
+    def repository(self, mock_session):
+        """Create a SqlUserRepository instance with a mocked session."""
+        return SqlUserRepository(session=mock_session)
+
+    @pytest.fixture
+    def user(self):
+        """Create a user holding two role assignments."""
+        user = User.Create(email="test@example.com", username="testuser", passwordHash="hash")
+        user.AddRoleAssignment(RoleAssignment.Create(userId=user.id, roleId=uuid4()))
+        user.AddRoleAssignment(RoleAssignment.Create(userId=user.id, roleId=uuid4()))
+        return user
+
+    @staticmethod
+    def _DeleteParameters(mock_session):
+        """Return the parameters the removed role assignments were deleted with."""
+        deletes = [
+            call.args[1]
+            for call in mock_session.execute.call_args_list
+            if call.args[0] is DELETE_REMOVED_ROLE_ASSIGNMENTS
+        ]
+        assert len(deletes) == 1
+        return deletes[0]
+
+    def test_save_deletes_removed_role_assignment(self, repository, mock_session, user):
+        """Test Save deletes the assignments removed from the user and keeps the others."""
+        removed, kept = user.roleAssignments
+        user.RemoveRoleAssignment(removed.id)
+
+        repository.Save(user)
+
+        assert self._DeleteParameters(mock_session) == {"userId": user.id, "keptIds": [kept.id]}
+
+    def test_save_deletes_all_role_assignments_once_cleared(self, repository, mock_session, user):
+        """Test Save deletes every assignment of a user whose assignments were cleared."""
+        user.ClearRoleAssignments()
+
+        repository.Save(user)
+
+        assert self._DeleteParameters(mock_session) == {"userId": user.id, "keptIds": []}
+        assert mock_session.execute.call_count == 3
@@ -0,0 +1,75 @@
+"""
+Unit tests for the Alembic migration helpers.
+"""
+
+from unittest.mock import MagicMock, patch
+import pytest
+from Migrations import BackfillInBatches
+
+
+class TestBackfillInBatches:
+    """Test cases for BackfillInBatches."""
+
+    @pytest.fixture
+    def mock_connection(self):
+        """Patch alembic's op so the helper talks to a mock connection."""
+        with patch("Migrations.op") as mock_op:
+            connection = MagicMock()
+            mock_op.get_bind.return_value = connection
+            yield connection, mock_op
+
+    @staticmethod
+    def _Batches(connection, *batches):
+        results = []
+        for batch in batches:
+            result = MagicMock()
+            result.scalars.return_value.all.return_value = batch
+            results.append(result)
+        connection.execute.side_effect = results
+
+    def test_runs_inside_autocommit_block(self, mock_connection):
+        """Test that batches are committed individually."""
+        connection, mock_op = mock_connection
+        self._Batches(connection, [])
+
+        BackfillInBatches("t_users", '"createdAt" = now()')
+
+        mock_op.get_context.return_value.autocommit_block.assert_called_once()
+
+    def test_stops_after_partial_batch(self, mock_connection):
+        """Test that a batch smaller than batchSize ends the backfill."""
+        connection, _ = mock_connection
+        self._Batches(connection, [1, 2], [3])
+
+        updatedRows = BackfillInBatches("t_users", '"createdAt" = now()', batchSize=2)
+
+        assert updatedRows == 3
+        assert connection.execute.call_count == 2
+
+    def test_pages_by_last_seen_id(self, mock_connection):
+        """Test that each batch resumes after the highest id of the previous one."""
+        connection, _ = mock_connection
+        self._Batches(connection, [1, 2], [3, 4], [])
+
+        updatedRows = BackfillInBatches(
+            "t_users", '"createdAt" = now()', '"createdAt" IS NULL', batchSize=2
+        )
+
+        assert updatedRows == 4
+        firstStatement, firstParams = connection.execute.call_args_list[0].args
+        secondStatement, secondParams = connection.execute.call_args_list[1].args
+        thirdParams = connection.execute.call_args_list[2].args[1]
+        assert ":lastId" not in str(firstStatement)
+        assert firstParams == {"batchSize": 2}
+        assert "id > :lastId" in str(secondStatement)
+        assert '"createdAt" IS NULL' in str(secondStatement)
+        assert secondParams == {"batchSize": 2, "lastId": 2}
+        assert thirdParams == {"batchSize": 2, "lastId": 4}
+
+    def test_empty_table(self, mock_connection):
+        """Test that nothing is updated when no row matches."""
+        connection, _ = mock_connection
+        self._Batches(connection, [])
+
+        assert BackfillInBatches("t_users", '"createdAt" = now()') == 0
+        assert connection.execute.call_count == 1
@@ -8,6 +8,7 @@ from unittest.mock import patch
 import pytest
 from pydantic import ValidationError
 from src.Shared.Config.AppConfig import AppConfig, OSType
+from src.Shared.Enums import LogLevelEnum
 
 
 class TestOSType:
@@ -74,6 +75,32 @@ class TestAppConfig:
         assert config.databaseUrl == "sqlite:///:memory:"
         assert config.port == 8000
         assert config.host == "localhost"
+        assert config.databasePoolSize == 20
+        assert config.databaseMaxOverflow == 40
+        assert config.databasePoolRecycleSeconds == 1800
+        assert config.queryCountWarningThreshold == 20
+
+    def test_negative_database_pool_setting_raises_error(self):
+        """Test that negative database pool settings are rejected."""
+        with pytest.raises(ValidationError):
+            AppConfig(
+                appName="TestApp",
+                version="1.0.0",
+                databaseUrl="sqlite:///:memory:",
+                logTarget="console",
+                databasePoolSize=-1,
+            )  # type: ignore
+
+    def test_non_positive_query_count_warning_threshold_raises_error(self):
+        """Test that a query count warning threshold below one is rejected."""
+        with pytest.raises(ValidationError):
+            AppConfig(
+                appName="TestApp",
+                version="1.0.0",
+                databaseUrl="sqlite:///:memory:",
+                logTarget="console",
+                queryCountWarningThreshold=0,
+            )  # type: ignore
 
 
 class TestAppConfigFromEnv:
@@ -128,6 +155,25 @@ class TestAppConfigFromEnv:
             assert config.port == 8000
             assert config.host == "localhost"
             assert config.logTarget == "console"
+            assert config.logLevel == LogLevelEnum.INFO
+
+    def test_from_env_log_level(self, temp_dir):
+        """Test LOG_LEVEL parsing and its default in debug mode."""
+        with patch.dict(
+            os.environ, {"DATABASE_URL": "sqlite:///:memory:", "LOG_LEVEL": "warning"}, clear=True
+        ):
+            assert AppConfig.FromEnv().logLevel == LogLevelEnum.WARNING
+
+        with patch.dict(
+            os.environ, {"DATABASE_URL": "sqlite:///:memory:", "DEBUG": "true"}, clear=True
+        ):
+            assert AppConfig.FromEnv().logLevel == LogLevelEnum.DEBUG
+
+        with patch.dict(
+            os.environ, {"DATABASE_URL": "sqlite:///:memory:", "LOG_LEVEL": "verbose"}, clear=True
+        ):
+            with pytest.raises(ValueError, match="LOG_LEVEL"):
+                AppConfig.FromEnv()
 
     def test_from_env_debug_case_insensitive(self, temp_dir):
         """Test DEBUG environment variable is case insensitive."""
@@ -304,7 +350,7 @@ class TestAppNameValidator:
 
     def test_invalid_app_name_characters_raise_error(self, base_config_data):
         """Test app names with invalid characters raise ValueError."""
-        invalid_names = ["App-Name", "App Name", "App@Name", "App.Name", "App/Name"]
+        invalid_names = ["App-Name", "App Name", "App@Name", "App.Name", "App/Name", "AppName\n"]
 
         for name in invalid_names:
             base_config_data["appName"] = name
@@ -351,7 +397,7 @@ class TestVersionValidator:
 
     def test_invalid_version_formats_raise_error(self, base_config_data):
         """Test invalid version formats raise ValueError."""
-        invalid_versions = ["1.0", "1.0.0.0", "v1.0.0", "1.0.0-beta", "1.x.0", "1.0.0a"]
+        invalid_versions = ["1.0", "1.0.0.0", "v1.0.0", "1.0.0-beta", "1.x.0", "1.0.0a", "1.0.0\n"]
 
         for version in invalid_versions:
             base_config_data["version"] = version
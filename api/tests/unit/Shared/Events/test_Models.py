@@ -95,13 +95,29 @@ class TestEventDispatcher:
         mock_subscriber2 = Mock()
         event_instance = MockEvent(data="test")
 
-        dispatcher.subscribers[event_instance] = [mock_subscriber1, mock_subscriber2]
+        dispatcher.subscribers[MockEvent] = [mock_subscriber1, mock_subscriber2]
 
         dispatcher.Dispatch(event_instance)
 
         mock_subscriber1.assert_called_once_with(event_instance)
         mock_subscriber2.assert_called_once_with(event_instance)
 
+    def test_dispatch_routes_by_exact_event_class(self):
+        """Test that dispatch only calls the subscribers registered for the event's class."""
+        dispatcher = EventDispatcher()
+        AnotherMockEvent = type("AnotherMockEvent", (MockEvent,), {})
+        mock_subscriber = Mock()
+        other_subscriber = Mock()
+        event_instance = MockEvent(data="test")
+
+        dispatcher.subscribers[MockEvent] = [mock_subscriber]
+        dispatcher.subscribers[AnotherMockEvent] = [other_subscriber]
+
+        dispatcher.Dispatch(event_instance)
+
+        mock_subscriber.assert_called_once_with(event_instance)
+        other_subscriber.assert_not_called()
+
     def test_dispatch_does_nothing_for_unregistered_event(self):
         """Test that dispatch silently returns for events with no subscribers."""
         dispatcher = EventDispatcher()
@@ -115,7 +131,7 @@ class TestEventDispatcher:
         dispatcher = EventDispatcher()
         event_instance = MockEvent(data="test")
 
-        dispatcher.subscribers[event_instance] = []
+        dispatcher.subscribers[MockEvent] = []
 
         # This should not raise an exception
         dispatcher.Dispatch(event_instance)
@@ -127,8 +143,7 @@ class TestEventDispatcher:
         event1 = MockEvent(data="event1")
         event2 = MockEvent(data="event2")
 
-        dispatcher.subscribers[event1] = [mock_subscriber]
-        dispatcher.subscribers[event2] = [mock_subscriber]
+        dispatcher.subscribers[MockEvent] = [mock_subscriber]
 
         dispatcher.DispatchAll([event1, event2])
 
@@ -153,11 +168,12 @@ class TestEventDispatcher:
         def subscriber2(event):
             call_order.append(f"event2-{event.data}")
 
+        AnotherMockEvent = type("AnotherMockEvent", (MockEvent,), {})
         event1 = MockEvent(data="first", name="event1")
-        event2 = MockEvent(data="second", name="event2")
+        event2 = AnotherMockEvent(data="second", name="event2")
 
-        dispatcher.subscribers[event1] = [subscriber1]
-        dispatcher.subscribers[event2] = [subscriber2]
+        dispatcher.subscribers[MockEvent] = [subscriber1]
+        dispatcher.subscribers[AnotherMockEvent] = [subscriber2]
 
         dispatcher.DispatchAll([event1, event2])
 
@@ -251,7 +267,7 @@ class TestEventEmitter:
         event = MockEvent(data="integration_test")
 
         # Setup dispatcher
-        dispatcher.subscribers[event] = [mock_subscriber]
+        dispatcher.subscribers[MockEvent] = [mock_subscriber]
 
         # Emit event
         emitter.EmitEvent(event)
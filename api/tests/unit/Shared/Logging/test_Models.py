@@ -8,6 +8,7 @@ import zipfile
 from unittest.mock import patch, mock_open, MagicMock, call
 from datetime import datetime
 import pytest
+from src.Shared.Enums import LogLevelEnum
 from src.Shared.Logging.Models import Logger
 
 
@@ -41,6 +42,27 @@ class TestLogger:
         """Test Logger initialization with console target."""
         assert console_logger.target == "console"
         assert console_logger.latestCallerSent is None
+        assert console_logger.level == LogLevelEnum.DEBUG
+
+    def test_is_enabled(self):
+        """Test that IsEnabled compares against the configured level."""
+        logger = Logger(target="console", level=LogLevelEnum.WARNING)
+
+        assert logger.IsEnabled(LogLevelEnum.ERROR) is True
+        assert logger.IsEnabled(LogLevelEnum.WARNING) is True
+        assert logger.IsEnabled(LogLevelEnum.INFO) is False
+        assert logger.IsEnabled(LogLevelEnum.DEBUG) is False
+
+    def test_messages_below_level_are_skipped(self):
+        """Test that messages below the configured level are not logged."""
+        logger = Logger(target="console", level=LogLevelEnum.WARNING)
+
+        with patch.object(logger, "_Log") as mock_log:
+            logger.Debug("Debug message")
+            logger.Info("Info message")
+            logger.Warning("Warning message")
+
+            mock_log.assert_called_once_with("[WARNING] - Warning message")
 
     def test_init_with_file_target(self, temp_dir):
         """Test Logger initialization with file target."""
@@ -108,33 +130,39 @@ class TestLogger:
         test_message = "Test message"
 
         with patch("src.Shared.Logging.Models.datetime") as mock_datetime:
-            mock_datetime.now.return_value.strftime.return_value = "2024-01-01 12:00:00"
+            mock_datetime.fromtimestamp.return_value.strftime.return_value = "2024-01-01 12:00:00"
 
             result = console_logger._PrependCurrentTime(test_message)
 
             assert result == "[2024-01-01 12:00:00] Test message"
 
+    def test_prepend_current_time_formats_once_per_second(self, console_logger):
+        """Test that the timestamp is formatted once and reused within the same second."""
+        with (
+            patch("src.Shared.Logging.Models.time.time", return_value=1704110400.5),
+            patch("src.Shared.Logging.Models.datetime") as mock_datetime,
+        ):
+            mock_datetime.fromtimestamp.return_value.strftime.return_value = "2024-01-01 12:00:00"
+
+            first = console_logger._PrependCurrentTime("First")
+            second = console_logger._PrependCurrentTime("Second")
+
+            assert first == "[2024-01-01 12:00:00] First"
+            assert second == "[2024-01-01 12:00:00] Second"
+            mock_datetime.fromtimestamp.assert_called_once_with(1704110400)
+
     def test_prepend_caller_info_first_time(self, console_logger):
         """Test that caller info is prepended the first time from a specific caller."""
         test_message = "Test message"
 
         # Mock the frame inspection
-        with patch("src.Shared.Logging.Models.inspect.currentframe") as mock_frame:
-            # Create a mock frame chain
+        with patch("src.Shared.Logging.Models.sys._getframe") as mock_frame:
+            # Create a mock caller frame
             mock_caller_frame = MagicMock()
             mock_caller_frame.f_code.co_name = "test_function"
             mock_caller_frame.f_code.co_filename = "test_file.py"
 
-            mock_log_frame = MagicMock()
-            mock_log_frame.f_back = mock_caller_frame
-
-            mock_prepend_frame = MagicMock()
-            mock_prepend_frame.f_back = mock_log_frame
-
-            mock_current_frame = MagicMock()
-            mock_current_frame.f_back = mock_prepend_frame
-
-            mock_frame.return_value = mock_current_frame
+            mock_frame.return_value = mock_caller_frame
 
             result = console_logger._PrependCallerInfo(test_message)
 
@@ -151,22 +179,13 @@ class TestLogger:
         # Set the latest caller to simulate previous call
         console_logger.latestCallerSent = caller_info
 
-        with patch("src.Shared.Logging.Models.inspect.currentframe") as mock_frame:
-            # Create a mock frame chain
+        with patch("src.Shared.Logging.Models.sys._getframe") as mock_frame:
+            # Create a mock caller frame
             mock_caller_frame = MagicMock()
             mock_caller_frame.f_code.co_name = "test_function"
             mock_caller_frame.f_code.co_filename = "test_file.py"
 
-            mock_log_frame = MagicMock()
-            mock_log_frame.f_back = mock_caller_frame
-
-            mock_prepend_frame = MagicMock()
-            mock_prepend_frame.f_back = mock_log_frame
-
-            mock_current_frame = MagicMock()
-            mock_current_frame.f_back = mock_prepend_frame
-
-            mock_frame.return_value = mock_current_frame
+            mock_frame.return_value = mock_caller_frame
 
             result = console_logger._PrependCallerInfo(test_message)
 
@@ -174,10 +193,10 @@ class TestLogger:
             assert result == test_message
 
     def test_prepend_caller_info_no_frame(self, console_logger):
-        """Test caller info prepending when frame is None."""
+        """Test caller info prepending when the call stack is too shallow."""
         test_message = "Test message"
 
-        with patch("src.Shared.Logging.Models.inspect.currentframe", return_value=None):
+        with patch("src.Shared.Logging.Models.sys._getframe", side_effect=ValueError):
             result = console_logger._PrependCallerInfo(test_message)
 
             assert result == test_message
@@ -265,6 +284,33 @@ class TestLogger:
                                 # Verify old file removal
                                 mock_remove.assert_called_once_with(expected_new_name)
 
+    def test_log_keeps_file_open_between_messages(self, file_logger):
+        """Test that consecutive messages are written through a single open file."""
+        file_logger._Log("First message")
+        logFile = file_logger.file
+
+        file_logger._Log("Second message")
+
+        assert file_logger.file is logFile
+        with open(file_logger.target, "r", encoding="utf-8") as f:
+            content = f.read()
+        assert "First message" in content
+        assert "Second message" in content
+
+    def test_log_rotates_once_tracked_size_exceeds_limit(self, file_logger):
+        """Test that the file is rotated and reopened once the written size passes the limit."""
+        file_logger._Log("First message")
+
+        with patch.object(Logger, "maxLogSize", 10):
+            file_logger._Log("Second message")
+            rotatedLogs = os.listdir(os.path.dirname(file_logger.target))
+
+        assert any(name.endswith(".zip") for name in rotatedLogs)
+        with open(file_logger.target, "r", encoding="utf-8") as f:
+            content = f.read()
+        assert "First message" not in content
+        assert "Second message" in content
+
     def test_log_rotate_nonexistent_file(self, file_logger):
         """Test log rotation when target file doesn't exist."""
         # Ensure file doesn't exist
@@ -294,22 +340,13 @@ class TestLogger:
     def test_multiple_log_calls_same_caller(self, console_logger):
         """Test multiple log calls from the same caller only show caller info once."""
         with patch("builtins.print") as mock_print:
-            with patch("src.Shared.Logging.Models.inspect.currentframe") as mock_frame:
+            with patch("src.Shared.Logging.Models.sys._getframe") as mock_frame:
                 # Setup mock frame
                 mock_caller_frame = MagicMock()
                 mock_caller_frame.f_code.co_name = "test_function"
                 mock_caller_frame.f_code.co_filename = "test_file.py"
 
-                mock_log_frame = MagicMock()
-                mock_log_frame.f_back = mock_caller_frame
-
-                mock_prepend_frame = MagicMock()
-                mock_prepend_frame.f_back = mock_log_frame
-
-                mock_current_frame = MagicMock()
-                mock_current_frame.f_back = mock_prepend_frame
-
-                mock_frame.return_value = mock_current_frame
+                mock_frame.return_value = mock_caller_frame
 
                 # First call
                 console_logger.Info("First message")
@@ -329,23 +366,14 @@ class TestLogger:
     def test_log_calls_different_callers(self, console_logger):
         """Test log calls from different callers show caller info for each new caller."""
         with patch("builtins.print") as mock_print:
-            with patch("src.Shared.Logging.Models.inspect.currentframe") as mock_frame:
+            with patch("src.Shared.Logging.Models.sys._getframe") as mock_frame:
 
                 # First caller
                 mock_caller_frame1 = MagicMock()
                 mock_caller_frame1.f_code.co_name = "first_function"
                 mock_caller_frame1.f_code.co_filename = "first_file.py"
 
-                mock_log_frame1 = MagicMock()
-                mock_log_frame1.f_back = mock_caller_frame1
-
-                mock_prepend_frame1 = MagicMock()
-                mock_prepend_frame1.f_back = mock_log_frame1
-
-                mock_current_frame1 = MagicMock()
-                mock_current_frame1.f_back = mock_prepend_frame1
-
-                mock_frame.return_value = mock_current_frame1
+                mock_frame.return_value = mock_caller_frame1
 
                 console_logger.Info("First caller message")
                 first_call_args = mock_print.call_args[0][0]
@@ -355,16 +383,7 @@ class TestLogger:
                 mock_caller_frame2.f_code.co_name = "second_function"
                 mock_caller_frame2.f_code.co_filename = "second_file.py"
 
-                mock_log_frame2 = MagicMock()
-                mock_log_frame2.f_back = mock_caller_frame2
-
-                mock_prepend_frame2 = MagicMock()
-                mock_prepend_frame2.f_back = mock_log_frame2
-
-                mock_current_frame2 = MagicMock()
-                mock_current_frame2.f_back = mock_prepend_frame2
-
-                mock_frame.return_value = mock_current_frame2
+                mock_frame.return_value = mock_caller_frame2
 
                 console_logger.Info("Second caller message")
                 second_call_args = mock_print.call_args[0][0]
@@ -0,0 +1,75 @@
+"""
+Unit tests for SqlUnitOfWork class.
+"""
+
+from unittest.mock import Mock
+import pytest
+from sqlalchemy.orm import Session as DatabaseSession
+from src.Shared.UnitOfWork.Models import SqlUnitOfWork
+
+
+class TestSqlUnitOfWork:
+    """Test cases for SqlUnitOfWork class."""
+
+    @pytest.fixture
+    def mock_session(self):
+        """Create a mock database session with real info storage."""
+        session = Mock(spec=DatabaseSession)
+        session.info = {}
+        return session
+
+    @pytest.fixture
+    def unit_of_work(self, mock_session):
+        """Create a unit of work bound to the mock session."""
+        return SqlUnitOfWork(session=mock_session)
+
+    def test_commits_on_success(self, unit_of_work, mock_session):
+        """Test that a clean exit commits the transaction."""
+        with unit_of_work:
+            pass
+
+        mock_session.commit.assert_called_once()
+        mock_session.rollback.assert_not_called()
+
+    def test_rolls_back_on_error(self, unit_of_work, mock_session):
+        """Test that an exception rolls the transaction back and is propagated."""
+        with pytest.raises(ValueError, match="boom"):
+            with unit_of_work:
+                raise ValueError("boom")
+
+        mock_session.rollback.assert_called_once()
+        mock_session.commit.assert_not_called()
+
+    def test_rolls_back_when_commit_fails(self, unit_of_work, mock_session):
+        """Test that a failing commit is rolled back and propagated."""
+        mock_session.commit.side_effect = RuntimeError("commit failed")
+
+        with pytest.raises(RuntimeError, match="commit failed"):
+            with unit_of_work:
+                pass
+
+        mock_session.rollback.assert_called_once()
+
+    def test_nested_units_commit_once(self, unit_of_work, mock_session):
+        """Test that only the outermost unit of work commits."""
+        inner = SqlUnitOfWork(session=mock_session)
+
+        with unit_of_work:
+            with inner:
+                pass
+            mock_session.commit.assert_not_called()
+
+        mock_session.commit.assert_called_once()
+        assert mock_session.info[SqlUnitOfWork.depthKey] == 0
+
+    def test_nested_error_rolls_back_once(self, unit_of_work, mock_session):
+        """Test that an error in a nested unit of work is rolled back by the outermost one."""
+        inner = SqlUnitOfWork(session=mock_session)
+
+        with pytest.raises(ValueError):
+            with unit_of_work:
+                with inner:
+                    raise ValueError("boom")
+
+        mock_session.rollback.assert_called_once()
+        mock_session.commit.assert_not_called()
@@ -0,0 +1,66 @@
+"""
+Unit tests for identifier helpers.
+"""
+
+import time
+from unittest.mock import patch
+from uuid import UUID
+from src.Shared.Identifiers import AsUuid, Uuid7
+
+
+class TestUuid7:
+    """Test cases for the Uuid7 generator."""
+
+    def test_returns_version_7_uuid(self):
+        """Test that generated identifiers are RFC 9562 version 7 UUIDs."""
+        identifier = Uuid7()
+
+        assert isinstance(identifier, UUID)
+        assert identifier.version == 7
+        assert identifier.variant == "specified in RFC 4122"
+
+    def test_embeds_current_timestamp(self):
+        """Test that the first 48 bits hold the unix timestamp in milliseconds."""
+        before = time.time_ns() // 1_000_000
+        identifier = Uuid7()
+        after = time.time_ns() // 1_000_000
+
+        assert before <= identifier.int >> 80 <= after
+
+    def test_later_identifiers_sort_after_earlier_ones(self):
+        """Test that identifiers generated in later milliseconds sort after earlier ones."""
+        with patch("src.Shared.Identifiers.time.time_ns", return_value=1_000_000_000_000):
+            earlier = Uuid7()
+        with patch("src.Shared.Identifiers.time.time_ns", return_value=1_000_001_000_000):
+            later = Uuid7()
+
+        assert earlier < later
+        assert str(earlier) < str(later)
+
+    def test_identifiers_are_unique(self):
+        """Test that identifiers generated within the same millisecond are unique."""
+        identifiers = {Uuid7() for _ in range(1000)}
+
+        assert len(identifiers) == 1000
+
+
+class TestAsUuid:
+    """Test cases for the AsUuid conversion helper."""
+
+    def test_returns_uuid_instances_unchanged(self):
+        """Test that native UUIDs from the driver are passed through as-is."""
+        identifier = Uuid7()
+
+        assert AsUuid(identifier) is identifier
+
+    def test_parses_strings(self):
+        """Test that string identifiers are parsed."""
+        identifier = Uuid7()
+
+        assert AsUuid(str(identifier)) == identifier
+
+    def test_reads_raw_bytes(self):
+        """Test that 16 byte binary identifiers are read without string parsing."""
+        identifier = Uuid7()
+
+        assert AsUuid(identifier.bytes) == identifier